@@ -0,0 +1,45 @@
+"""Binary search for many targets against the same sorted array."""
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def search_sorted(sorted_array, targets, side="left"):
+    """Return the insertion position of every target in the sorted array.
+
+    Uses one vectorized numpy call when numpy is available and falls
+    back to a bisect loop over an array('l') of positions otherwise.
+    """
+    if side not in ("left", "right"):
+        raise ValueError("side must be 'left' or 'right', got %r" % (side,))
+    if np is not None:
+        return np.searchsorted(np.asarray(sorted_array), np.asarray(targets), side=side)
+    bisect = bisect_left if side == "left" else bisect_right
+    return array("l", [bisect(sorted_array, target) for target in targets])
+
+
+def binary_search_batch(sorted_array, targets):
+    """Return the index of every target in the sorted array, or -1 if missing.
+
+    Same answer as calling binary_search once per target, except that a
+    target with duplicates always maps to its leftmost occurrence.
+    """
+    if np is not None:
+        haystack = np.asarray(sorted_array)
+        needles = np.asarray(targets)
+        positions = np.searchsorted(haystack, needles)
+        if len(haystack) == 0:
+            return np.full(len(needles), -1, dtype=np.intp)
+        clipped = np.minimum(positions, len(haystack) - 1)
+        return np.where(haystack[clipped] == needles, positions, -1)
+
+    size = len(sorted_array)
+    hits = array("l")
+    for target in targets:
+        position = bisect_left(sorted_array, target)
+        hits.append(position if position < size and sorted_array[position] == target else -1)
+    return hits
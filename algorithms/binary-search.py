@@ -1,6 +1,9 @@
 import big_o
-def binary_search(array):
-    target = 9999
+from algorithms.batch_search import binary_search_batch
+from algorithms.search_strategies import STRATEGIES, choose_strategy
+
+
+def binary_search(array, target=9999):
     low = 0
     high = len(array) - 1
 
@@ -14,6 +17,32 @@ def binary_search(array):
             low = mid+1
     return -1
 
+
+def scalar_loop(data):
+    array, targets = data
+    return [binary_search(array, target) for target in targets]
+
+
+def batch(data):
+    array, targets = data
+    return binary_search_batch(array, targets)
+
+
 positive_int_generator = lambda n: big_o.datagen.integers(n, 0, 10000)
 best, others = big_o.big_o(binary_search, positive_int_generator, n_repeats=100)
 print(best)
+
+# Many lookups against the same sorted array: one Python loop per target
+# versus a single vectorized call for all of them.
+sorted_with_targets_generator = lambda n: (sorted(positive_int_generator(n)), positive_int_generator(n))
+for name, func in (("scalar loop", scalar_loop), ("batch", batch)):
+    best, others = big_o.big_o(func, sorted_with_targets_generator, n_repeats=10)
+    print(name, best)
+
+# Uniform keys are where interpolation search should beat log2(n) probes.
+sorted_int_generator = lambda n: sorted(positive_int_generator(n))
+print("auto picks", choose_strategy(sorted_int_generator(100000)))
+for name in ("binary", "interpolation", "exponential"):
+    strategy = STRATEGIES[name]
+    best, others = big_o.big_o(lambda array: strategy(array, 9999), sorted_int_generator, n_repeats=100)
+    print(name, best)
@@ -0,0 +1,115 @@
+"""Level-by-level breadth-first search with hop limits and match queries.
+
+Works on dict-of-lists graphs like algorithms/dataset.py, dict-of-dicts
+graphs (the keys are the neighbours) and CSRGraph.
+"""
+from collections import namedtuple
+
+from algorithms.csr_graph import CSRGraph
+
+BFSResult = namedtuple("BFSResult", "distances parents matches")
+
+
+def bfs(graph, start, is_match=None, max_hops=None, find_all=False):
+    """Breadth-first search from start.
+
+    Nodes are marked as seen when they are enqueued, so each one enters
+    the frontier once. Returns BFSResult(distances, parents, matches):
+    hop counts and BFS-tree parents of every node reached, and the
+    nodes for which is_match(node) is true in BFS order. Without
+    find_all the search stops at the first match; max_hops stops it
+    after that many levels.
+    """
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, start, is_match, max_hops, find_all)
+
+    distances = {start: 0}
+    parents = {start: None}
+    matches = []
+    if is_match is not None and is_match(start):
+        matches.append(start)
+        if not find_all:
+            return BFSResult(distances, parents, matches)
+
+    frontier = [start]
+    hops = 0
+    while frontier and (max_hops is None or hops < max_hops):
+        hops += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in graph.get(node, ()):
+                if neighbor in distances:
+                    continue
+                distances[neighbor] = hops
+                parents[neighbor] = node
+                next_frontier.append(neighbor)
+                if is_match is not None and is_match(neighbor):
+                    matches.append(neighbor)
+                    if not find_all:
+                        return BFSResult(distances, parents, matches)
+        frontier = next_frontier
+    return BFSResult(distances, parents, matches)
+
+
+def _bfs_csr(graph, start, is_match, max_hops, find_all):
+    # Works on ids and an array of distances; names only come back at the end.
+    names = graph.names
+    offsets, targets = graph.offsets, graph.targets
+    distance = [-1] * graph.node_count
+    parent = [-1] * graph.node_count
+    matches = []
+    source = graph.id_of(start)
+    distance[source] = 0
+    reached = [source]
+
+    def result():
+        return BFSResult({names[node]: distance[node] for node in reached},
+                         {names[node]: names[parent[node]] if parent[node] >= 0 else None
+                          for node in reached},
+                         [names[node] for node in matches])
+
+    if is_match is not None and is_match(start):
+        matches.append(source)
+        if not find_all:
+            return result()
+
+    frontier = [source]
+    hops = 0
+    while frontier and (max_hops is None or hops < max_hops):
+        hops += 1
+        next_frontier = []
+        for node in frontier:
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[i]
+                if distance[neighbor] >= 0:
+                    continue
+                distance[neighbor] = hops
+                parent[neighbor] = node
+                next_frontier.append(neighbor)
+                if is_match is not None and is_match(names[neighbor]):
+                    matches.append(neighbor)
+                    if not find_all:
+                        reached.extend(next_frontier)
+                        return result()
+        reached.extend(next_frontier)
+        frontier = next_frontier
+    return result()
+
+
+def within_hops(graph, start, is_match, max_hops):
+    """Every node matching is_match at most max_hops away, nearest first."""
+    return bfs(graph, start, is_match, max_hops, find_all=True).matches
+
+
+def first_match(graph, start, is_match, max_hops=None):
+    """Nearest node matching is_match and its path from start, or (None, None)."""
+    result = bfs(graph, start, is_match, max_hops)
+    if not result.matches:
+        return None, None
+    node = result.matches[0]
+    path = []
+    while node is not None:
+        path.append(node)
+        node = result.parents[node]
+    path.reverse()
+    return result.matches[0], path
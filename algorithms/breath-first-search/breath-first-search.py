@@ -1,24 +1,18 @@
-from collections import deque
+from algorithms.breadth_first import bfs, first_match, within_hops
+from algorithms.csr_graph import CSRGraph
 from algorithms.dataset import graph
 
 def person_is_seller(name):
     return name[-1]=='m'
-def searchBreathFirst(name):
-    queue = deque()
-    queue += graph[name]
-    searched = set()
-    while queue:
-        person = queue.popleft()
-        print(person)
-        for person in graph[person]:
-            if person not in searched:
-                if person_is_seller(person):
-                    print(person + " is a mango seller")
-                    return True
-                else:
-                    queue += graph[person]
-                    searched.add(person)
+def searchBreathFirst(name, graph=graph):
+    seller, path = first_match(graph, name, person_is_seller)
+    if seller is not None:
+        print(seller + " is a mango seller, reached through " + " -> ".join(path))
+        return True
+    return False
 
 
 searchBreathFirst("you")
-
+searchBreathFirst("you", CSRGraph.from_adjacency(graph))
+print(bfs(graph, "you").distances)
+print(within_hops(graph, "you", person_is_seller, 2))
@@ -0,0 +1,87 @@
+"""Single-pass search for several targets in any buffer-protocol object.
+
+array.array, bytes, bytearray, mmap and numpy arrays are all read
+through a memoryview, so the data is never copied as a whole.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many targets, list.index per target (a C loop) beats a
+# Python loop testing every element against a set.
+_INDEX_LOOP_TARGETS = 8
+
+
+def as_view(buffer, format=None):
+    """Return a flat memoryview of buffer, reinterpreted as format if given."""
+    view = memoryview(buffer)
+    if format is not None and view.format != format:
+        view = view.cast("B").cast(format)
+    elif view.ndim != 1:
+        view = view.cast("B").cast(view.format)
+    return view
+
+
+def scan(buffer, targets, find_all=False, format=None, chunk_size=1 << 16):
+    """Find every target in buffer in a single pass.
+
+    Returns a dict mapping each target to its first position (-1 when
+    absent) or, with find_all=True, to the list of all its positions.
+    Positions count items of format, e.g. 4-byte ints for 'i'.
+    """
+    view = as_view(buffer, format)
+    targets = set(targets)
+    if np is not None:
+        return _scan_numpy(view, targets, find_all)
+    return _scan_chunked(view, targets, find_all, chunk_size)
+
+
+def _scan_numpy(view, targets, find_all):
+    values = np.frombuffer(view, dtype=view.format)
+    wanted = np.array(list(targets))
+    positions = np.flatnonzero(np.isin(values, wanted))
+    hits = values[positions]
+    if find_all:
+        result = {target: [] for target in targets}
+        order = np.argsort(hits, kind="stable")
+        keys, starts = np.unique(hits[order], return_index=True)
+        for key, group in zip(keys.tolist(), np.split(positions[order], starts[1:])):
+            result[key] = group.tolist()
+        return result
+    result = dict.fromkeys(targets, -1)
+    keys, first = np.unique(hits, return_index=True)
+    result.update(zip(keys.tolist(), positions[first].tolist()))
+    return result
+
+
+def _scan_chunked(view, targets, find_all, chunk_size):
+    result = {target: [] for target in targets} if find_all else dict.fromkeys(targets, -1)
+    pending = set(targets)
+    for start in range(0, len(view), chunk_size):
+        # Only one chunk at a time is turned into Python objects.
+        items = view[start:start + chunk_size].tolist()
+        if len(pending) <= _INDEX_LOOP_TARGETS:
+            for target in list(pending):
+                i = -1
+                while True:
+                    try:
+                        i = items.index(target, i + 1)
+                    except ValueError:
+                        break
+                    if not find_all:
+                        result[target] = start + i
+                        pending.discard(target)
+                        break
+                    result[target].append(start + i)
+        else:
+            for i, item in enumerate(items):
+                if item in pending:
+                    if find_all:
+                        result[item].append(start + i)
+                    else:
+                        result[item] = start + i
+                        pending.discard(item)
+        if not pending:
+            break
+    return result
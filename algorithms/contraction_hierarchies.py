@@ -0,0 +1,382 @@
+"""Contraction hierarchies for fast repeated route queries on a static graph.
+
+Preprocessing removes ("contracts") nodes one at a time, least important
+first. When removing v would break a shortest path u -> v -> w, a
+shortcut u -> w remembering v as its middle node is added. A query then
+runs bidirectional Dijkstra that only ever moves to more important
+nodes, which settles a tiny part of the graph. Shortcuts on the result
+are unpacked back into original edges.
+
+save() writes the index in a versioned binary format laid out like
+graph_file's, all integers little-endian and every section 8-byte
+aligned:
+
+    header        magic b"CHIX", version u16, flags u16 (0),
+                  node_count u64, up_count u64, down_count u64,
+                  names_size u64
+    name offsets  (node_count + 1) x u64 into the names blob
+    names         repr() of every node in UTF-8, back to back
+    rank          node_count x i64
+    up            offsets (node_count + 1) x i64, then up_count x i32
+                  targets, up_count x f64 weights and up_count x i32
+                  shortcut middles (-1 for an original edge)
+    down          the same four arrays over down_count in-edges
+
+Nodes are numbered in contraction order. Names are read back with
+ast.literal_eval, so nodes must be literals: strings, numbers or tuples
+of them, like the (x, y) nodes of road_graph. Costs come back as floats.
+
+Run from the repository root to measure preprocessing and queries:
+
+    python -m algorithms.contraction_hierarchies [width]
+"""
+from array import array
+import ast
+import heapq
+from itertools import count
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+from algorithms.csr_graph import ID_TYPECODE, OFFSET_TYPECODE, WEIGHT_TYPECODE
+from algorithms.graph_file import _align, _check_byte_order
+from algorithms.point_to_point import Route, bidirectional_dijkstra, reverse_graph, road_graph
+from algorithms.shortest_paths import infinity
+
+MAGIC = b"CHIX"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHQQQQ")
+
+
+def _layout(node_count, up_count, down_count, names_size):
+    """Byte offset of every section, plus the total file size."""
+    sections = {}
+    position = _align(_HEADER.size)
+    sizes = [("name_offsets", 8 * (node_count + 1)), ("names", names_size),
+             ("rank", 8 * node_count)]
+    for direction, edge_count in (("up", up_count), ("down", down_count)):
+        sizes += [(direction + "_offsets", 8 * (node_count + 1)),
+                  (direction + "_targets", 4 * edge_count),
+                  (direction + "_weights", 8 * edge_count),
+                  (direction + "_middle", 4 * edge_count)]
+    for name, size in sizes:
+        sections[name] = position
+        position = _align(position + size)
+    return sections, position
+
+
+def _encode_name(node):
+    text = repr(node)
+    try:
+        same = ast.literal_eval(text) == node
+    except (ValueError, SyntaxError):
+        same = False
+    if not same:
+        raise ValueError("node %s cannot be saved: its repr is not a literal" % text)
+    return text.encode("utf-8")
+
+
+def _witness_costs(out, source, excluded, max_cost, limit):
+    """Costs from source that avoid excluded, giving up after limit nodes."""
+    costs = {source: 0}
+    order = count()
+    heap = [(0, next(order), source)]
+    settled = 0
+    while heap and settled < limit:
+        cost, _, node = heapq.heappop(heap)
+        if cost > costs[node]:
+            continue
+        if cost > max_cost:
+            break
+        settled += 1
+        for neighbor, weight in out[node].items():
+            if neighbor == excluded:
+                continue
+            new_cost = cost + weight
+            if new_cost < costs.get(neighbor, infinity):
+                costs[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, next(order), neighbor))
+    return costs
+
+
+def _shortcuts(out, inn, node, limit):
+    """The (u, w, cost) shortcuts needed if node were contracted now."""
+    needed = []
+    for u, weight_in in inn[node].items():
+        candidates = [(w, weight_in + weight_out) for w, weight_out in out[node].items() if w != u]
+        if not candidates:
+            continue
+        costs = _witness_costs(out, u, node, max(cost for _, cost in candidates), limit)
+        for w, cost in candidates:
+            # A witness of equal cost is as good as the path through node.
+            if costs.get(w, infinity) > cost:
+                needed.append((u, w, cost))
+    return needed
+
+
+class ContractionHierarchy:
+    """Search index built once from a dict-of-dicts graph."""
+
+    def __init__(self, rank, up, down, middle):
+        self.rank = rank  # node -> contraction order
+        self.up = up  # node -> {higher node: cost} over out-edges
+        self.down = down  # node -> {higher node: cost} over in-edges
+        self.middle = middle  # (u, w) -> node a shortcut u -> w skips
+        self.build_seconds = 0.0
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        """Contract graph, ordering nodes by edge difference with lazy updates.
+
+        witness_limit caps every witness search; a lower cap builds faster
+        but may add shortcuts that were not needed.
+        """
+        started = time.perf_counter()
+        out = {node: {} for node in graph}
+        inn = {node: {} for node in graph}
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                out.setdefault(neighbor, {})
+                inn.setdefault(neighbor, {})
+                if neighbor != node and weight < out[node].get(neighbor, infinity):
+                    out[node][neighbor] = weight
+                    inn[neighbor][node] = weight
+
+        contracted_neighbors = dict.fromkeys(out, 0)
+
+        def priority(node):
+            shortcuts = len(_shortcuts(out, inn, node, witness_limit))
+            return (shortcuts - len(out[node]) - len(inn[node])
+                    + contracted_neighbors[node])
+
+        order = count()
+        heap = [(priority(node), next(order), node) for node in out]
+        heapq.heapify(heap)
+        rank = {}
+        up = {}
+        down = {}
+        middle = {}
+        while heap:
+            _, _, node = heapq.heappop(heap)
+            # Lazy update: priorities go stale as neighbours are contracted,
+            # so recheck this node against the next best before taking it.
+            current = priority(node)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, next(order), node))
+                continue
+
+            for u, w, cost in _shortcuts(out, inn, node, witness_limit):
+                if cost < out[u].get(w, infinity):
+                    out[u][w] = cost
+                    inn[w][u] = cost
+                    middle[(u, w)] = node
+            # Every edge still attached leads to a node contracted later,
+            # that is to a more important one.
+            rank[node] = len(rank)
+            up[node] = out.pop(node)
+            down[node] = inn.pop(node)
+            for neighbor in up[node]:
+                del inn[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            for neighbor in down[node]:
+                del out[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+
+        hierarchy = cls(rank, up, down, middle)
+        hierarchy.build_seconds = time.perf_counter() - started
+        return hierarchy
+
+    @property
+    def shortcut_count(self):
+        return len(self.middle)
+
+    def query(self, source, target):
+        """Return Route(cost, path, settled) for the shortest source -> target path."""
+        if source == target:
+            return Route(0, [source], 0)
+        order = count()
+        searches = []
+        for start, edges in ((source, self.up), (target, self.down)):
+            searches.append({"edges": edges, "costs": {start: 0}, "parents": {start: None},
+                             "heap": [(0, next(order), start)], "settled": 0})
+        best = infinity
+        meeting = None
+        # Both searches only climb, so neither can stop at the first meeting;
+        # each runs until its smallest key cannot improve on best.
+        for search, other in (searches, searches[::-1]):
+            heap = search["heap"]
+            costs = search["costs"]
+            while heap and heap[0][0] < best:
+                cost, _, node = heapq.heappop(heap)
+                if cost > costs[node]:
+                    continue
+                search["settled"] += 1
+                through = cost + other["costs"].get(node, infinity)
+                if through < best:
+                    best = through
+                    meeting = node
+                for neighbor, weight in search["edges"].get(node, {}).items():
+                    new_cost = cost + weight
+                    if new_cost < costs.get(neighbor, infinity):
+                        costs[neighbor] = new_cost
+                        search["parents"][neighbor] = node
+                        heapq.heappush(heap, (new_cost, next(order), neighbor))
+            # Nodes the backward search already settled may meet the forward
+            # search's final costs.
+            for node, cost in other["costs"].items():
+                through = cost + costs.get(node, infinity)
+                if through < best:
+                    best = through
+                    meeting = node
+
+        settled = searches[0]["settled"] + searches[1]["settled"]
+        if meeting is None:
+            return Route(infinity, None, settled)
+        hops = []
+        node = meeting
+        while node is not None:
+            hops.append(node)
+            node = searches[0]["parents"][node]
+        hops.reverse()
+        node = searches[1]["parents"][meeting]
+        while node is not None:
+            hops.append(node)
+            node = searches[1]["parents"][node]
+        return Route(best, self._unpack(hops), settled)
+
+    def _unpack(self, hops):
+        path = [hops[0]]
+        for u, w in zip(hops, hops[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                node = self.middle.get((a, b))
+                if node is None:
+                    path.append(b)
+                else:
+                    stack.append((node, b))
+                    stack.append((a, node))
+        return path
+
+    def _edge_arrays(self, ids, edges, key):
+        """CSR offsets, targets, weights and middles of the up or down edges."""
+        offsets = array(OFFSET_TYPECODE, [0])
+        targets = array(ID_TYPECODE)
+        weights = array(WEIGHT_TYPECODE)
+        middles = array(ID_TYPECODE)
+        for node in self.rank:
+            for other, weight in edges[node].items():
+                targets.append(ids[other])
+                weights.append(weight)
+                middle = self.middle.get(key(node, other))
+                middles.append(-1 if middle is None else ids[middle])
+            offsets.append(len(targets))
+        return offsets, targets, weights, middles
+
+    def save(self, path):
+        """Write the hierarchy to path in the binary format of the module docstring."""
+        _check_byte_order()
+        ids = {node: i for i, node in enumerate(self.rank)}
+        encoded = [_encode_name(node) for node in self.rank]
+        name_offsets = array("Q", [0])
+        for name in encoded:
+            name_offsets.append(name_offsets[-1] + len(name))
+        up = self._edge_arrays(ids, self.up, lambda node, other: (node, other))
+        down = self._edge_arrays(ids, self.down, lambda node, other: (other, node))
+        node_count = len(ids)
+        sections, size = _layout(node_count, len(up[1]), len(down[1]), name_offsets[-1])
+        with open(path, "wb") as target:
+            target.truncate(size)
+            target.write(_HEADER.pack(MAGIC, VERSION, 0, node_count, len(up[1]), len(down[1]),
+                                      name_offsets[-1]))
+            buffers = [("name_offsets", name_offsets), ("names", b"".join(encoded)),
+                       ("rank", array("q", self.rank.values()))]
+            for direction, arrays in (("up", up), ("down", down)):
+                for suffix, buffer in zip(("_offsets", "_targets", "_weights", "_middle"), arrays):
+                    buffers.append((direction + suffix, buffer))
+            for name, buffer in buffers:
+                target.seek(sections[name])
+                target.write(buffer)
+
+    @classmethod
+    def load(cls, path):
+        """Read a hierarchy written by save(); ValueError if it is not one."""
+        _check_byte_order()
+        with open(path, "rb") as source:
+            data = source.read()
+        if len(data) < _HEADER.size:
+            raise ValueError("%s is not a contraction hierarchy file" % path)
+        magic, version, _, node_count, up_count, down_count, names_size = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("%s is not a contraction hierarchy file" % path)
+        if version != VERSION:
+            raise ValueError("%s has contraction hierarchy format version %d, expected %d"
+                             % (path, version, VERSION))
+        sections, size = _layout(node_count, up_count, down_count, names_size)
+        if len(data) < size:
+            raise ValueError("%s is truncated" % path)
+
+        view = memoryview(data)
+
+        def section(name, count, typecode, itemsize):
+            start = sections[name]
+            return view[start:start + count * itemsize].cast(typecode)
+
+        name_offsets = section("name_offsets", node_count + 1, "Q", 8)
+        names = view[sections["names"]:sections["names"] + names_size]
+        nodes = [ast.literal_eval(str(names[start:stop], "utf-8"))
+                 for start, stop in zip(name_offsets, name_offsets[1:])]
+        rank = dict(zip(nodes, section("rank", node_count, "q", 8)))
+        middle = {}
+
+        def edges(direction, edge_count, key):
+            offsets = section(direction + "_offsets", node_count + 1, OFFSET_TYPECODE, 8)
+            targets = section(direction + "_targets", edge_count, ID_TYPECODE, 4)
+            weights = section(direction + "_weights", edge_count, WEIGHT_TYPECODE, 8)
+            middles = section(direction + "_middle", edge_count, ID_TYPECODE, 4)
+            result = {}
+            for i, node in enumerate(nodes):
+                row = result[node] = {}
+                for edge in range(offsets[i], offsets[i + 1]):
+                    other = nodes[targets[edge]]
+                    row[other] = weights[edge]
+                    if middles[edge] >= 0:
+                        middle[key(node, other)] = nodes[middles[edge]]
+            return result
+
+        up = edges("up", up_count, lambda node, other: (node, other))
+        down = edges("down", down_count, lambda node, other: (other, node))
+        return cls(rank, up, down, middle)
+
+
+def benchmark(width=40, queries=200, seed=1):
+    graph, _ = road_graph(width, width, seed=seed)
+    edges = sum(len(neighbors) for neighbors in graph.values())
+    hierarchy = ContractionHierarchy.build(graph)
+    build_seconds = hierarchy.build_seconds
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "index.ch")
+        hierarchy.save(path)
+        index_size = os.path.getsize(path)
+        hierarchy = ContractionHierarchy.load(path)
+    print("%d nodes, %d edges: built in %.2fs, %d shortcuts, index %d bytes"
+          % (len(graph), edges, build_seconds, hierarchy.shortcut_count, index_size))
+
+    rng = random.Random(seed)
+    nodes = list(graph)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+    reverse = reverse_graph(graph)
+    for name, run in (("bidirectional dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t, reverse)),
+                      ("contraction hierarchy", hierarchy.query)):
+        start = time.perf_counter()
+        routes = [run(s, t) for s, t in pairs]
+        elapsed = time.perf_counter() - start
+        print("%-24s %8.3f ms/query %8.0f settled/query"
+              % (name, 1000 * elapsed / queries, sum(route.settled for route in routes) / queries))
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
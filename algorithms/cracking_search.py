@@ -0,0 +1,147 @@
+"""Adaptive search that sorts an unsorted array a little on every query.
+
+Database cracking: the first lookup is a linear scan, but it also
+partitions the scanned range around the key. Each later lookup only has
+to scan the one piece its key can fall in, so per-query cost falls
+toward binary-search cost as queries accumulate and the data is never
+sorted up front.
+
+Run from the repository root to replay a query sequence:
+
+    python -m algorithms.cracking_search
+"""
+from array import array
+from bisect import bisect_left
+import random
+import time
+
+
+class CrackingIndex:
+    """Cracks a private copy of data; the caller's array is left alone."""
+
+    def __init__(self, data):
+        if isinstance(data, array):
+            self.values = array(data.typecode, data)
+        else:
+            self.values = list(data)
+        # Original position of every value, permuted alongside it.
+        self.rowids = array("l", range(len(self.values)))
+        # Sorted (key, inclusive) bounds and, for each bound, the position
+        # p such that values[:p] are < key (<= key when inclusive).
+        self._bounds = []
+        self._positions = []
+        self.history = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def _crack(self, key, inclusive):
+        bound = (key, inclusive)
+        i = bisect_left(self._bounds, bound)
+        if i < len(self._bounds) and self._bounds[i] == bound:
+            return self._positions[i], 0
+        low = self._positions[i - 1] if i > 0 else 0
+        high = self._positions[i] if i < len(self._positions) else len(self.values)
+
+        values = self.values
+        rowids = self.rowids
+        left, right = low, high - 1
+        while left <= right:
+            value = values[left]
+            if value < key or (inclusive and value == key):
+                left += 1
+                continue
+            value = values[right]
+            if not (value < key or (inclusive and value == key)):
+                right -= 1
+                continue
+            values[left], values[right] = values[right], values[left]
+            rowids[left], rowids[right] = rowids[right], rowids[left]
+            left += 1
+            right -= 1
+
+        self._bounds.insert(i, bound)
+        self._positions.insert(i, left)
+        return left, high - low
+
+    def _lookup(self, key):
+        start, touched_low = self._crack(key, False)
+        stop, touched_high = self._crack(key, True)
+        self.history.append(touched_low + touched_high)
+        return start, stop
+
+    def search(self, key):
+        """Return True if key is present, like linear_search."""
+        start, stop = self._lookup(key)
+        return stop > start
+
+    def count(self, key):
+        start, stop = self._lookup(key)
+        return stop - start
+
+    def positions(self, key):
+        """Return the original positions of key in the input, in order."""
+        start, stop = self._lookup(key)
+        return sorted(self.rowids[start:stop])
+
+    def stats(self, window=100):
+        """Summarise how much of the array each query had to touch.
+
+        cost_curve holds the mean number of elements touched per query
+        for each consecutive window of queries.
+        """
+        history = self.history
+        return {
+            "queries": len(history),
+            "pieces": len(self._bounds) + 1,
+            "touched": sum(history),
+            "last_cost": history[-1] if history else 0,
+            "cost_curve": [sum(history[i:i + window]) / len(history[i:i + window])
+                           for i in range(0, len(history), window)],
+        }
+
+
+def _linear_search(array, target):
+    # Same loop as linear-search.py.
+    for i in range(len(array)):
+        if array[i] == target:
+            return True
+    return False
+
+
+def _binary_search(array, target):
+    position = bisect_left(array, target)
+    return position < len(array) and array[position] == target
+
+
+def replay(data, queries, checkpoints=(1, 10, 100, 1000)):
+    """Print cumulative time of the query sequence for each approach."""
+    def run(name, search):
+        start = time.perf_counter()
+        marks = []
+        for done, key in enumerate(queries, 1):
+            search(key)
+            if done in checkpoints:
+                marks.append("%d: %.3fs" % (done, time.perf_counter() - start))
+        print("%-24s %s" % (name, "  ".join(marks)))
+
+    run("linear search", lambda key: _linear_search(data, key))
+
+    sorted_data = []
+
+    def sort_then_search(key):
+        if not sorted_data:
+            sorted_data.extend(sorted(data))
+        return _binary_search(sorted_data, key)
+
+    run("sort + binary search", sort_then_search)
+
+    index = CrackingIndex(data)
+    run("cracking", index.search)
+    print("cracking cost per query:", [round(cost) for cost in index.stats()["cost_curve"]])
+
+
+if __name__ == "__main__":
+    data = array("i", (random.randint(0, 10000) for _ in range(100000)))
+    queries = [random.randint(0, 10000) for _ in range(1000)]
+    replay(data, queries)
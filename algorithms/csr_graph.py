@@ -0,0 +1,182 @@
+"""Compressed sparse row graphs with node names interned to integer ids.
+
+Node i's out-edges are targets[offsets[i]:offsets[i + 1]], with the
+matching weights in the same slice of weights. Three flat buffers
+replace a dict (and a str key) per node and per edge, which is what
+lets a single process hold graphs with many millions of edges.
+
+Run from the repository root for a bytes-per-edge comparison:
+
+    python -m algorithms.csr_graph [nodes] [edges]
+"""
+from array import array
+import random
+import sys
+
+# 4-byte node ids are enough below 2**31 nodes; offsets count edges.
+ID_TYPECODE = "i"
+OFFSET_TYPECODE = "q"
+WEIGHT_TYPECODE = "d"
+
+
+class CSRGraph:
+    """Directed graph in CSR form; weights is None for unweighted graphs.
+
+    offsets, targets and weights may be array.array, numpy arrays or
+    memoryviews. names maps id -> name and only needs indexing and len().
+    """
+
+    def __init__(self, names, offsets, targets, weights=None):
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._ids = None
+
+    @property
+    def node_count(self):
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def id_of(self, name):
+        if self._ids is None:
+            self._ids = {node: i for i, node in enumerate(self.names)}
+        return self._ids[name]
+
+    def __len__(self):
+        return self.node_count
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        try:
+            self.id_of(name)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, name):
+        """Neighbour names, so code written for dict-of-lists graphs works."""
+        names = self.names
+        return [names[target] for target in self.neighbors(self.id_of(name))]
+
+    def neighbors(self, node):
+        """Target ids of node's out-edges, by id."""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def edges(self, node):
+        """(target id, weight) pairs of node's out-edges; weight 1 if unweighted."""
+        start, stop = self.offsets[node], self.offsets[node + 1]
+        if self.weights is None:
+            return ((target, 1) for target in self.targets[start:stop])
+        return zip(self.targets[start:stop], self.weights[start:stop])
+
+    @property
+    def nbytes(self):
+        """Bytes held by the offsets, targets and weights buffers."""
+        total = 0
+        for buffer in (self.offsets, self.targets, self.weights):
+            if buffer is not None:
+                total += len(memoryview(buffer).cast("B"))
+        return total
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """Build from a dict of neighbour lists, like algorithms/dataset.py."""
+        return cls._build(graph, lambda node: graph[node], weighted=False)
+
+    @classmethod
+    def from_weighted(cls, graph):
+        """Build from a dict of {neighbour: weight} dicts, like dijkstras_algorithm.py."""
+        return cls._build(graph, lambda node: graph[node].items(), weighted=True)
+
+    @classmethod
+    def _build(cls, graph, out_edges, weighted):
+        ids = {}
+        names = []
+
+        def intern(name):
+            node = ids.get(name)
+            if node is None:
+                node = ids[name] = len(names)
+                names.append(name)
+            return node
+
+        for name in graph:
+            intern(name)
+        offsets = array(OFFSET_TYPECODE, [0])
+        targets = array(ID_TYPECODE)
+        weights = array(WEIGHT_TYPECODE) if weighted else None
+        # Names first seen as targets get ids past the keys of graph and
+        # no out-edges, so walk ids rather than the keys.
+        node = 0
+        while node < len(names):
+            name = names[node]
+            if name in graph:
+                for edge in out_edges(name):
+                    if weighted:
+                        targets.append(intern(edge[0]))
+                        weights.append(edge[1])
+                    else:
+                        targets.append(intern(edge))
+            offsets.append(len(targets))
+            node += 1
+        result = cls(names, offsets, targets, weights)
+        result._ids = ids
+        return result
+
+    def to_adjacency(self):
+        names = self.names
+        return {names[node]: [names[target] for target in self.neighbors(node)]
+                for node in range(self.node_count)}
+
+    def to_weighted(self):
+        names = self.names
+        return {names[node]: {names[target]: weight for target, weight in self.edges(node)}
+                for node in range(self.node_count)}
+
+
+def dict_graph_nbytes(graph):
+    """Deep size of a dict-of-lists or dict-of-dicts graph, counting each object once."""
+    seen = set()
+
+    def size(obj):
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        total = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            total += sum(size(key) + size(value) for key, value in obj.items())
+        elif isinstance(obj, (list, tuple)):
+            total += sum(size(item) for item in obj)
+        return total
+
+    return size(graph)
+
+
+def memory_report(graph):
+    """Print bytes per edge of a dict graph next to its CSR equivalent."""
+    weighted = any(isinstance(edges, dict) for edges in graph.values())
+    csr = CSRGraph.from_weighted(graph) if weighted else CSRGraph.from_adjacency(graph)
+    edges = max(csr.edge_count, 1)
+    dict_bytes = dict_graph_nbytes(graph)
+    names_bytes = dict_graph_nbytes(list(csr.names))
+    print("%d nodes, %d edges" % (csr.node_count, csr.edge_count))
+    print("dict graph   %12d bytes  %8.1f bytes/edge" % (dict_bytes, dict_bytes / edges))
+    print("CSR buffers  %12d bytes  %8.1f bytes/edge" % (csr.nbytes, csr.nbytes / edges))
+    print("CSR + names  %12d bytes  %8.1f bytes/edge"
+          % (csr.nbytes + names_bytes, (csr.nbytes + names_bytes) / edges))
+
+
+if __name__ == "__main__":
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    edges = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    graph = {"n%d" % node: {} for node in range(nodes)}
+    names = list(graph)
+    for _ in range(edges):
+        graph[random.choice(names)][random.choice(names)] = random.randint(1, 100)
+    memory_report(graph)
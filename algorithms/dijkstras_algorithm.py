@@ -1,3 +1,6 @@
+from algorithms.dynamic_shortest_paths import DynamicShortestPaths
+from algorithms.shortest_paths import find_path, shortest_paths
+
 # the graph
 graph = {}
 graph["start"] = {}
@@ -68,3 +71,13 @@ while node is not None:
 print("Cost from the start to each node:")
 print(costs)
 
+# The same search as a reusable function: a heap instead of scanning every
+# node, and tables built from the start node instead of by hand.
+start_costs, start_parents = shortest_paths(graph, "start")
+print(start_costs)
+print("Path to fin:", find_path(start_parents, "fin"))
+
+# When an edge cost changes, repair the tables instead of starting over.
+paths = DynamicShortestPaths(graph, "start", check=True)
+paths.set_edge("b", "a", 7)
+print("After b -> a costs 7:", paths.costs, "repaired", paths.last_repair, "nodes")
@@ -0,0 +1,158 @@
+"""Single-source shortest paths kept up to date while edge weights change.
+
+Instead of recomputing the costs and parents tables after every change,
+only the part of the shortest-path tree that a change can affect is
+repaired, in the spirit of Ramalingam and Reps:
+
+- a cheaper or new edge can only lower costs, so Dijkstra is restarted
+  from its head and stops wherever nothing improves;
+- a dearer or removed tree edge invalidates the subtree under it, which
+  is cleared and rebuilt from its cheapest way in from outside.
+"""
+import heapq
+from itertools import count
+import math
+
+from algorithms.shortest_paths import infinity, shortest_paths
+
+
+class DynamicShortestPaths:
+    """Costs and parents tables from source over a private copy of graph."""
+
+    def __init__(self, graph, source, check=False):
+        self.graph = {node: dict(neighbors) for node, neighbors in graph.items()}
+        self.incoming = {}
+        for node, neighbors in list(self.graph.items()):
+            for neighbor, weight in neighbors.items():
+                self.graph.setdefault(neighbor, {})
+                self.incoming.setdefault(neighbor, {})[node] = weight
+        self.source = source
+        self.check = check
+        self.costs, self.parents = shortest_paths(self.graph, source)
+        self.children = {}
+        for node, parent in self.parents.items():
+            if parent is not None:
+                self.children.setdefault(parent, set()).add(node)
+        # Nodes whose cost was recomputed by the last update.
+        self.last_repair = 0
+
+    def _validate(self, updates):
+        # Later updates in a batch see the edges left by earlier ones.
+        pending = {}
+        for node, neighbor, weight in updates:
+            if weight is not None and weight < 0:
+                raise ValueError("negative edge weight %r on %r -> %r" % (weight, node, neighbor))
+            edge = (node, neighbor)
+            old = pending[edge] if edge in pending else self.graph.get(node, {}).get(neighbor)
+            if weight is None and old is None:
+                raise KeyError(edge)
+            pending[edge] = weight
+
+    def set_edge(self, node, neighbor, weight):
+        """Insert the edge node -> neighbor or change its weight."""
+        self.apply([(node, neighbor, weight)])
+
+    def remove_edge(self, node, neighbor):
+        self.apply([(node, neighbor, None)])
+
+    def apply(self, updates):
+        """Apply (node, neighbor, weight) updates at once; weight None deletes.
+
+        The whole batch is repaired in a single pass, which is cheaper
+        than one repair per update when changes overlap. It is checked
+        before anything changes, so a bad update leaves the graph as it was.
+        """
+        updates = list(updates)
+        self._validate(updates)
+        invalid_roots = []
+        lowered = []
+        for node, neighbor, weight in updates:
+            old = self.graph.setdefault(node, {}).get(neighbor)
+            self.graph.setdefault(neighbor, {})
+            if weight is None:
+                if old is None:
+                    raise KeyError((node, neighbor))
+                del self.graph[node][neighbor]
+                del self.incoming[neighbor][node]
+            else:
+                self.graph[node][neighbor] = weight
+                self.incoming.setdefault(neighbor, {})[node] = weight
+            if old is not None and (weight is None or weight > old):
+                if self.parents.get(neighbor) == node:
+                    invalid_roots.append(neighbor)
+            elif weight is not None and (old is None or weight < old):
+                lowered.append((node, neighbor))
+
+        order = count()
+        heap = []
+        repaired = set()
+
+        invalid = self._detach_subtrees(invalid_roots)
+        for node in invalid:
+            # Cheapest way in from the part of the tree that is still valid.
+            best, parent = infinity, None
+            for predecessor, weight in self.incoming.get(node, {}).items():
+                cost = self.costs.get(predecessor, infinity) + weight
+                if cost < best:
+                    best, parent = cost, predecessor
+            if parent is not None:
+                self._relink(node, parent, best)
+                heapq.heappush(heap, (best, next(order), node))
+        for node, neighbor in lowered:
+            weight = self.graph[node].get(neighbor)
+            if weight is None:
+                continue  # removed again later in the same batch
+            cost = self.costs.get(node, infinity) + weight
+            if cost < self.costs.get(neighbor, infinity):
+                self._relink(neighbor, node, cost)
+                heapq.heappush(heap, (cost, next(order), neighbor))
+
+        while heap:
+            cost, _, node = heapq.heappop(heap)
+            if cost > self.costs[node]:
+                continue
+            repaired.add(node)
+            for neighbor, weight in self.graph[node].items():
+                new_cost = cost + weight
+                if new_cost < self.costs.get(neighbor, infinity):
+                    self._relink(neighbor, node, new_cost)
+                    heapq.heappush(heap, (new_cost, next(order), neighbor))
+
+        self.last_repair = len(repaired | invalid)
+        if self.check:
+            mismatches = self.verify()
+            if mismatches:
+                raise AssertionError("repaired costs differ from a full recompute at %r" % mismatches)
+
+    def _detach_subtrees(self, roots):
+        """Drop every node under roots from the tables; return them as a set."""
+        invalid = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node in invalid:
+                continue
+            invalid.add(node)
+            stack.extend(self.children.pop(node, ()))
+        for node in invalid:
+            parent = self.parents.pop(node, None)
+            if parent is not None and parent not in invalid:
+                self.children[parent].discard(node)
+            self.costs.pop(node, None)
+        return invalid
+
+    def _relink(self, node, parent, cost):
+        old_parent = self.parents.get(node)
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        self.parents[node] = parent
+        self.children.setdefault(parent, set()).add(node)
+        self.costs[node] = cost
+
+    def verify(self):
+        """Return the nodes whose cost disagrees with a full recompute."""
+        costs, _ = shortest_paths(self.graph, self.source)
+        nodes = set(costs) | set(self.costs)
+        return sorted((node for node in nodes
+                       if not math.isclose(costs.get(node, infinity), self.costs.get(node, infinity))),
+                      key=repr)
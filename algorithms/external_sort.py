@@ -0,0 +1,186 @@
+"""Sort integer or text files that do not fit in memory.
+
+The input is read in runs that fit the memory budget. Each run is
+sorted in memory and spilled to a temporary file in a compact binary
+format: raw 8-byte ints, or length-prefixed bytes for text. The runs
+are then heap-merged fan_in at a time until a single pass can write
+the output.
+
+Run from the repository root:
+
+    python -m algorithms.external_sort int|text INPUT OUTPUT [budget_mb]
+"""
+from array import array
+import heapq
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from algorithms.integer_sort import integer_sort
+
+_LENGTH = struct.Struct("<I")
+# Rough per-line cost of a bytes object in a list, on top of its length.
+_BYTES_OVERHEAD = 41
+
+
+def print_progress(phase, records, seconds):
+    rate = records / seconds if seconds else 0.0
+    print("%-6s %12d records  %8.1fs  %12.0f records/s" % (phase, records, seconds, rate),
+          file=sys.stderr)
+
+
+class _IntFormat:
+    """8-byte signed integers, one per text line in the input and output."""
+
+    @staticmethod
+    def read_runs(source, budget):
+        limit = max(budget // 8, 1)
+        run = array("q")
+        for line in source:
+            if line.strip():
+                run.append(int(line))
+                if len(run) >= limit:
+                    yield run
+                    run = array("q")
+        if run:
+            yield run
+
+    @staticmethod
+    def sort(run):
+        return integer_sort(run)
+
+    @staticmethod
+    def write(records, target):
+        array("q", records).tofile(target)
+
+    @staticmethod
+    def read(source, buffer_size):
+        items = max(buffer_size // 8, 1)
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(source, items)
+            except EOFError:
+                pass
+            if not block:
+                return
+            yield from block
+
+    @staticmethod
+    def write_output(records, target):
+        target.writelines(b"%d\n" % record for record in records)
+
+
+class _TextFormat:
+    """Lines of bytes; byte order equals code point order for UTF-8."""
+
+    @staticmethod
+    def read_runs(source, budget):
+        run = []
+        used = 0
+        for line in source:
+            line = line.rstrip(b"\r\n")
+            run.append(line)
+            used += len(line) + _BYTES_OVERHEAD
+            if used >= budget:
+                yield run
+                run = []
+                used = 0
+        if run:
+            yield run
+
+    @staticmethod
+    def sort(run):
+        run.sort()
+        return run
+
+    @staticmethod
+    def write(records, target):
+        pack = _LENGTH.pack
+        for record in records:
+            target.write(pack(len(record)))
+            target.write(record)
+
+    @staticmethod
+    def read(source, buffer_size):
+        read = source.read
+        while True:
+            header = read(_LENGTH.size)
+            if not header:
+                return
+            yield read(_LENGTH.unpack(header)[0])
+
+    @staticmethod
+    def write_output(records, target):
+        target.writelines(record + b"\n" for record in records)
+
+
+FORMATS = {"int": _IntFormat, "text": _TextFormat}
+
+
+def external_sort(input_path, output_path, kind="int", memory_budget=64 << 20,
+                  fan_in=16, tmp_dir=None, progress=None):
+    """Sort input_path into output_path using about memory_budget bytes.
+
+    progress, if given, is called as progress(phase, records, seconds)
+    after every spilled run and merge pass; print_progress prints it.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2, got %d" % fan_in)
+    try:
+        format = FORMATS[kind]
+    except KeyError:
+        raise ValueError("unknown kind %r, expected one of %s" % (kind, sorted(FORMATS))) from None
+
+    started = time.perf_counter()
+    records = 0
+
+    def report(phase):
+        if progress is not None:
+            progress(phase, records, time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workdir:
+        runs = []
+        with open(input_path, "rb") as source:
+            for run in format.read_runs(source, memory_budget):
+                path = os.path.join(workdir, "run-%d" % len(runs))
+                with open(path, "wb") as target:
+                    format.write(format.sort(run), target)
+                runs.append(path)
+                records += len(run)
+                report("run")
+
+        buffer_size = max(memory_budget // (fan_in + 1), 1 << 12)
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                path = os.path.join(workdir, "merge-%d-%d" % (len(runs), i))
+                with open(path, "wb") as target:
+                    _merge(format, runs[i:i + fan_in], buffer_size, target, format.write)
+                merged.append(path)
+            for path in runs:
+                os.remove(path)
+            runs = merged
+            report("merge")
+
+        with open(output_path, "wb") as target:
+            _merge(format, runs, buffer_size, target, format.write_output)
+        report("done")
+    return records
+
+
+def _merge(format, paths, buffer_size, target, write):
+    sources = [open(path, "rb", buffering=buffer_size) for path in paths]
+    try:
+        write(heapq.merge(*(format.read(source, buffer_size) for source in sources)), target)
+    finally:
+        for source in sources:
+            source.close()
+
+
+if __name__ == "__main__":
+    kind, input_path, output_path = sys.argv[1:4]
+    budget = int(sys.argv[4]) << 20 if len(sys.argv) > 4 else 64 << 20
+    external_sort(input_path, output_path, kind, budget, progress=print_progress)
@@ -0,0 +1,257 @@
+"""Versioned binary file format for CSRGraph, loaded with mmap.
+
+Layout, all integers little-endian and every section 8-byte aligned:
+
+    header        magic b"CSRG", version u16, flags u16,
+                  node_count u64, edge_count u64, names_size u64
+    name offsets  (node_count + 1) x u64 into the names blob
+    names         UTF-8 node names, back to back
+    offsets       (node_count + 1) x i64, the CSR row offsets
+    targets       edge_count x i32
+    weights       edge_count x f64, only when flags has WEIGHTED
+
+load_graph() maps the file and wraps each section in a memoryview, so
+loading costs the same for any graph size and traversals read the
+mapped pages in place. Names are decoded one at a time, on use.
+
+Run from the repository root to convert an edge list:
+
+    python -m algorithms.graph_file EDGES.csv|EDGES.tsv OUTPUT.csrg
+"""
+from array import array
+import csv
+import mmap
+import os
+import struct
+import sys
+
+from algorithms.csr_graph import CSRGraph, ID_TYPECODE, OFFSET_TYPECODE, WEIGHT_TYPECODE
+
+MAGIC = b"CSRG"
+VERSION = 1
+WEIGHTED = 1
+_HEADER = struct.Struct("<4sHHQQQ")
+
+
+def _check_byte_order():
+    if sys.byteorder != "little":
+        raise ValueError("graph files are read in place and need a little-endian machine")
+
+
+def _align(position):
+    return (position + 7) & ~7
+
+
+def _layout(node_count, edge_count, names_size, weighted):
+    """Byte offset of every section, plus the total file size."""
+    sections = {}
+    position = _align(_HEADER.size)
+    for name, size in (("name_offsets", 8 * (node_count + 1)),
+                       ("names", names_size),
+                       ("offsets", 8 * (node_count + 1)),
+                       ("targets", 4 * edge_count),
+                       ("weights", 8 * edge_count if weighted else 0)):
+        sections[name] = position
+        position = _align(position + size)
+    return sections, position
+
+
+class _NameTable:
+    """Sequence of node names decoded lazily from the mapped names section."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node):
+        if not 0 <= node < len(self):
+            raise IndexError(node)
+        return str(self._blob[self._offsets[node]:self._offsets[node + 1]], "utf-8")
+
+    def __iter__(self):
+        return (self[node] for node in range(len(self)))
+
+
+def _write_header_and_names(target, names, node_count, edge_count, weighted):
+    encoded = [str(name).encode("utf-8") for name in names]
+    names_size = sum(len(name) for name in encoded)
+    sections, size = _layout(node_count, edge_count, names_size, weighted)
+    target.truncate(size)
+    target.seek(0)
+    target.write(_HEADER.pack(MAGIC, VERSION, WEIGHTED if weighted else 0,
+                              node_count, edge_count, names_size))
+    target.seek(sections["name_offsets"])
+    position = 0
+    for name in encoded:
+        target.write(struct.pack("<Q", position))
+        position += len(name)
+    target.write(struct.pack("<Q", position))
+    target.seek(sections["names"])
+    target.writelines(encoded)
+    return sections
+
+
+def save_graph(graph, path):
+    """Write a CSRGraph to path in the binary graph format."""
+    _check_byte_order()
+    weighted = graph.weights is not None
+    with open(path, "wb") as target:
+        sections = _write_header_and_names(target, graph.names, graph.node_count,
+                                           graph.edge_count, weighted)
+        for name, buffer, typecode in (("offsets", graph.offsets, OFFSET_TYPECODE),
+                                       ("targets", graph.targets, ID_TYPECODE),
+                                       ("weights", graph.weights, WEIGHT_TYPECODE)):
+            if buffer is None:
+                continue
+            target.seek(sections[name])
+            view = memoryview(buffer)
+            if view.format != typecode:
+                view = memoryview(array(typecode, buffer))
+            target.write(view)
+
+
+def load_graph(path):
+    """Map a graph file and return a CSRGraph reading straight from it."""
+    _check_byte_order()
+    with open(path, "rb") as source:
+        buffer = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, node_count, edge_count, names_size = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("%s is not a graph file" % path)
+    if version != VERSION:
+        raise ValueError("%s has graph format version %d, expected %d" % (path, version, VERSION))
+    weighted = bool(flags & WEIGHTED)
+    sections, size = _layout(node_count, edge_count, names_size, weighted)
+    if len(buffer) < size:
+        raise ValueError("%s is truncated" % path)
+
+    # The views keep the mmap alive for as long as the graph uses them.
+    view = memoryview(buffer)
+
+    def section(name, count, typecode, itemsize):
+        start = sections[name]
+        return view[start:start + count * itemsize].cast(typecode)
+
+    names = _NameTable(section("name_offsets", node_count + 1, "Q", 8),
+                       view[sections["names"]:sections["names"] + names_size])
+    return CSRGraph(names,
+                    section("offsets", node_count + 1, OFFSET_TYPECODE, 8),
+                    section("targets", edge_count, ID_TYPECODE, 4),
+                    section("weights", edge_count, WEIGHT_TYPECODE, 8) if weighted else None)
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _edge_rows(path, delimiter, header):
+    """Yield the rows of an edge list, checked and without its header.
+
+    header=None skips a first row whose weight is not a number or that
+    starts with source,target; True and False force it either way.
+    """
+    with open(path, newline="", encoding="utf-8") as source:
+        reader = csv.reader(source, delimiter=delimiter)
+        first = True
+        for row in reader:
+            if not row or row[0].startswith("#"):
+                continue
+            if first:
+                first = False
+                if header is None:
+                    header = ((len(row) > 2 and not _is_number(row[2]))
+                              or [name.strip().lower() for name in row[:2]] == ["source", "target"])
+                if header:
+                    continue
+            if len(row) < 2:
+                raise ValueError("%s:%d: expected source%starget[%sweight], got %r"
+                                 % (path, reader.line_num, delimiter, delimiter, row))
+            if len(row) > 2 and not _is_number(row[2]):
+                raise ValueError("%s:%d: weight %r is not a number"
+                                 % (path, reader.line_num, row[2]))
+            yield row
+
+
+def convert_edge_list(input_path, output_path, delimiter=None, header=None):
+    """Convert a 'source,target[,weight]' edge list into a graph file.
+
+    Streams the text twice: once to intern names, count out-degrees and
+    check every row, once to drop each edge into its slot of the mapped
+    output. Memory grows with the number of nodes, never with the size
+    of the text. A .tsv file is read tab-separated unless delimiter says
+    otherwise; see _edge_rows for header. A bad row raises ValueError
+    before the output file is created.
+    """
+    _check_byte_order()
+    if delimiter is None:
+        delimiter = "\t" if input_path.endswith(".tsv") else ","
+
+    ids = {}
+    degrees = array(OFFSET_TYPECODE)
+    edge_count = 0
+    weighted = False
+    for row in _edge_rows(input_path, delimiter, header):
+        for name in row[:2]:
+            if name not in ids:
+                ids[name] = len(ids)
+                degrees.append(0)
+        degrees[ids[row[0]]] += 1
+        edge_count += 1
+        weighted = weighted or len(row) > 2
+
+    node_count = len(ids)
+    try:
+        with open(output_path, "w+b") as target:
+            sections = _write_header_and_names(target, ids, node_count, edge_count, weighted)
+            target.flush()
+            with mmap.mmap(target.fileno(), 0) as buffer, memoryview(buffer) as view:
+                _fill_edges(view, sections, input_path, delimiter, header,
+                            ids, degrees, node_count, edge_count, weighted)
+    except BaseException:
+        os.remove(output_path)
+        raise
+    return node_count, edge_count
+
+
+def _fill_edges(view, sections, input_path, delimiter, header,
+                ids, degrees, node_count, edge_count, weighted):
+    # Every view over the mmap is released on the way out, even on error:
+    # a live export would turn the real exception into a BufferError.
+    start = sections["offsets"]
+    with view[start:start + 8 * (node_count + 1)].cast(OFFSET_TYPECODE) as offsets:
+        position = 0
+        for node, degree in enumerate(degrees):
+            offsets[node] = position
+            degrees[node] = position  # reused as the next free slot
+            position += degree
+        offsets[node_count] = position
+
+    start = sections["targets"]
+    with view[start:start + 4 * edge_count].cast(ID_TYPECODE) as targets:
+        weights = None
+        if weighted:
+            start = sections["weights"]
+            weights = view[start:start + 8 * edge_count].cast(WEIGHT_TYPECODE)
+        try:
+            for row in _edge_rows(input_path, delimiter, header):
+                source = ids[row[0]]
+                slot = degrees[source]
+                degrees[source] += 1
+                targets[slot] = ids[row[1]]
+                if weights is not None:
+                    weights[slot] = float(row[2]) if len(row) > 2 else 1.0
+        finally:
+            if weights is not None:
+                weights.release()
+
+
+if __name__ == "__main__":
+    nodes, edges = convert_edge_list(sys.argv[1], sys.argv[2])
+    print("%s: %d nodes, %d edges, %d bytes" % (sys.argv[2], nodes, edges, os.path.getsize(sys.argv[2])))
@@ -0,0 +1,107 @@
+"""In-place introsort for lists and array.array.
+
+Quicksort with a median-of-three pivot and three-way partitioning, so
+runs of equal keys are finished in a single pass. Ranges of at most
+SMALL_RANGE items are left to insertion sort, and a range that recurses
+deeper than 2 * log2(n) levels is finished with heapsort, which keeps
+the worst case at O(n log n).
+"""
+SMALL_RANGE = 16
+
+
+def introsort(array, low=0, high=None):
+    """Sort array[low:high] in place."""
+    if high is None:
+        high = len(array)
+    _introsort(array, low, high, 2 * max(high - low, 1).bit_length())
+
+
+def _introsort(array, low, high, depth):
+    while high - low > SMALL_RANGE:
+        if depth == 0:
+            heapsort(array, low, high)
+            return
+        depth -= 1
+        pivot = median_of_three(array[low], array[(low + high) // 2], array[high - 1])
+        less_end, greater_start = partition3(array, low, high, pivot)
+        # Recurse into the smaller side and loop on the larger one, so the
+        # stack never grows past log2(n) frames.
+        if less_end - low < high - greater_start:
+            _introsort(array, low, less_end, depth)
+            low = greater_start
+        else:
+            _introsort(array, greater_start, high, depth)
+            high = less_end
+    insertion_sort(array, low, high)
+
+
+def median_of_three(a, b, c):
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def partition3(array, low, high, pivot):
+    """Partition array[low:high] into < pivot, == pivot and > pivot.
+
+    Returns (lt, gt) such that array[low:lt] < pivot, array[lt:gt] ==
+    pivot and array[gt:high] > pivot.
+    """
+    lt = i = low
+    gt = high
+    while i < gt:
+        value = array[i]
+        if value < pivot:
+            array[i] = array[lt]
+            array[lt] = value
+            lt += 1
+            i += 1
+        elif pivot < value:
+            gt -= 1
+            array[i] = array[gt]
+            array[gt] = value
+        else:
+            i += 1
+    return lt, gt
+
+
+def insertion_sort(array, low=0, high=None):
+    if high is None:
+        high = len(array)
+    for i in range(low + 1, high):
+        value = array[i]
+        j = i - 1
+        while j >= low and value < array[j]:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = value
+
+
+def heapsort(array, low=0, high=None):
+    if high is None:
+        high = len(array)
+    size = high - low
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(array, low, root, size)
+    for end in range(size - 1, 0, -1):
+        array[low], array[low + end] = array[low + end], array[low]
+        _sift_down(array, low, 0, end)
+
+
+def _sift_down(array, offset, root, size):
+    value = array[offset + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and array[offset + child] < array[offset + child + 1]:
+            child += 1
+        if not value < array[offset + child]:
+            break
+        array[offset + root] = array[offset + child]
+        root = child
+    array[offset + root] = value
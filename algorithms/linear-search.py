@@ -1,15 +1,33 @@
 from array import array
 import big_o
+from algorithms.buffer_scan import scan
 
 
-def linear_search(array):
-    target = 9999
+def linear_search(array, target=9999):
     for i in range(len(array)):
         if array[i] == target:
             return True
 
     return False
 
+
+def linear_search_each(data):
+    array, targets = data
+    return {target: linear_search(array, target) for target in targets}
+
+
+def scan_once(data):
+    array, targets = data
+    return scan(array, targets)
+
+
 positive_int_generator = lambda n: big_o.datagen.integers(n, 0, 10000)
 best, others = big_o.big_o(linear_search, positive_int_generator, n_repeats=100)
-print(best)
\ No newline at end of file
+print(best)
+
+# Twenty targets: one pass over the buffer per target versus a single pass
+# that looks for all of them.
+int_array_with_targets_generator = lambda n: (array("i", positive_int_generator(n)), list(range(9980, 10000)))
+for name, func in (("linear search per target", linear_search_each), ("scan", scan_once)):
+    best, others = big_o.big_o(func, int_array_with_targets_generator, n_repeats=10)
+    print(name, best)
@@ -0,0 +1,162 @@
+"""Distance matrices from many sources, one Dijkstra per source in a process pool.
+
+The graph is handed to the workers once by the pool initializer:
+inherited through fork where the platform has it, otherwise pickled
+once per worker. Tasks only carry a source index, so no task pickles the
+graph.
+
+Run from the repository root to compare process counts:
+
+    python -m algorithms.many_to_many [width] [sources]
+"""
+from array import array
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+
+from algorithms.point_to_point import road_graph
+from algorithms.shortest_paths import infinity, shortest_paths
+from algorithms.worker_pool import make_pool
+
+# Matrix files start with the row and column counts, then the rows.
+_HEADER = struct.Struct("=QQ")
+
+_graph = None
+_sources = None
+_targets = None
+_matrix_path = None
+_matrix = None
+
+
+def _share(graph, sources, targets, matrix_path):
+    # Pool initializer: the only place these globals are set, so they
+    # exist in worker processes and never in the caller's.
+    global _graph, _sources, _targets, _matrix_path
+    _graph, _sources, _targets, _matrix_path = graph, sources, targets, matrix_path
+
+
+def _mapped_matrix():
+    # Mapped once per process, on its first row.
+    global _matrix
+    if _matrix is None:
+        with open(_matrix_path, "r+b") as target:
+            _matrix = mmap.mmap(target.fileno(), 0)
+    return _matrix
+
+
+def _cost_row(graph, source, targets):
+    costs, _ = shortest_paths(graph, source)
+    return array("d", [costs.get(target, infinity) for target in targets])
+
+
+def _write_row(matrix, index, row):
+    start = _HEADER.size + index * len(row) * row.itemsize
+    matrix[start:start + len(row) * row.itemsize] = row.tobytes()
+
+
+def _row(index):
+    row = _cost_row(_graph, _sources[index], _targets)
+    if _matrix_path is None:
+        return index, row
+    # Matrix mode: write the row straight into the mapped file and only
+    # report which row is done.
+    _write_row(_mapped_matrix(), index, row)
+    return index, None
+
+
+def _rows_in_process(graph, sources, targets, matrix_path):
+    # State stays local so interleaved generators cannot see each other's graph.
+    matrix = None
+    if matrix_path is not None:
+        with open(matrix_path, "r+b") as target:
+            matrix = mmap.mmap(target.fileno(), 0)
+    try:
+        for index, source in enumerate(sources):
+            row = _cost_row(graph, source, targets)
+            if matrix is None:
+                yield index, row
+            else:
+                _write_row(matrix, index, row)
+                yield index, None
+    finally:
+        if matrix is not None:
+            matrix.close()
+
+
+def _run(graph, sources, targets, processes, chunksize, matrix_path):
+    sources = list(sources)
+    targets = list(targets)
+    processes = processes or os.cpu_count()
+    if processes == 1 or len(sources) == 1:
+        yield from _rows_in_process(graph, sources, targets, matrix_path)
+        return
+    if chunksize is None:
+        # A few chunks per worker balances uneven search times without
+        # paying a round trip for every source.
+        chunksize = max(1, len(sources) // (4 * processes))
+    pool = make_pool(processes, _share, (graph, sources, targets, matrix_path))
+    try:
+        yield from pool.imap_unordered(_row, range(len(sources)), chunksize)
+    finally:
+        pool.terminate()
+
+
+def many_to_many(graph, sources, targets, processes=None, chunksize=None):
+    """Yield (source, row) pairs as the searches finish, in any order.
+
+    row[j] is the cost from source to targets[j], infinity if unreachable.
+    """
+    sources = list(sources)
+    for index, row in _run(graph, sources, targets, processes, chunksize, None):
+        yield sources[index], row
+
+
+def many_to_many_matrix(graph, sources, targets, path, processes=None, chunksize=None):
+    """Write the len(sources) x len(targets) cost matrix to path.
+
+    The file holds a (rows, columns) header, then native float64 values,
+    row-major, filled in place by the workers; read it back with
+    load_matrix. An empty matrix is just the header.
+    """
+    sources = list(sources)
+    targets = list(targets)
+    with open(path, "wb") as target:
+        target.write(_HEADER.pack(len(sources), len(targets)))
+        target.truncate(_HEADER.size + len(sources) * len(targets) * array("d").itemsize)
+    if not sources or not targets:
+        return
+    for _ in _run(graph, sources, targets, processes, chunksize, path):
+        pass
+
+
+def load_matrix(path):
+    """Map a matrix file as a list of rows of memoryviews."""
+    with open(path, "rb") as source:
+        rows, columns = _HEADER.unpack(source.read(_HEADER.size))
+        if not rows or not columns:
+            # Nothing to map: mmap refuses an empty range.
+            return [memoryview(array("d")) for _ in range(rows)]
+        buffer = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    matrix = memoryview(buffer)[_HEADER.size:].cast("d")
+    return [matrix[start:start + columns] for start in range(0, rows * columns, columns)]
+
+
+def benchmark(width=40, source_count=64):
+    graph, _ = road_graph(width, width, seed=1)
+    nodes = list(graph)
+    sources = random.Random(1).sample(nodes, source_count)
+    base = None
+    for processes in range(1, os.cpu_count() + 1):
+        start = time.perf_counter()
+        for _ in many_to_many(graph, sources, nodes, processes):
+            pass
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print("processes=%-3d %.3fs  speedup %.2fx" % (processes, elapsed, base / elapsed))
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
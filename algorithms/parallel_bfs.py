@@ -0,0 +1,242 @@
+"""Level-synchronous BFS over a CSRGraph split by node range across processes.
+
+Each worker owns a contiguous range of node ids. Every level, the
+workers read the shared frontier and visited bitmaps and write the
+nodes they discover into their own next-frontier bitmap in shared
+memory; the parent ORs those bitmaps into the next frontier.
+
+Levels with a small frontier run top-down: each worker walks the
+out-edges of the frontier nodes it owns. Once the frontier's edges
+outweigh what is left unvisited, levels run bottom-up instead
+(direction-optimizing BFS): each worker checks its unvisited nodes for
+any in-neighbour in the frontier and stops at the first one.
+
+Run from the repository root for the speedup against breadth_first.bfs:
+
+    python -m algorithms.parallel_bfs [nodes] [edges]
+"""
+from array import array
+from multiprocessing import shared_memory
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from algorithms.breadth_first import bfs
+from algorithms.csr_graph import ID_TYPECODE, OFFSET_TYPECODE
+from algorithms.random_graphs import random_csr
+from algorithms.worker_pool import attach, make_pool
+
+# Beamer's thresholds: go bottom-up once frontier edges exceed unexplored
+# edges / ALPHA, back top-down once the frontier drops below nodes / BETA.
+ALPHA = 14
+BETA = 24
+
+_state = None
+_block = None
+
+
+def reverse_csr(graph):
+    """Return offsets and targets of the in-edges of every node."""
+    node_count = graph.node_count
+    offsets = array(OFFSET_TYPECODE, [0]) * (node_count + 1)
+    for target in graph.targets:
+        offsets[target + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    cursor = array(OFFSET_TYPECODE, offsets[:-1])
+    sources = array(ID_TYPECODE, [0]) * graph.edge_count
+    for node in range(node_count):
+        for i in range(graph.offsets[node], graph.offsets[node + 1]):
+            target = graph.targets[i]
+            sources[cursor[target]] = node
+            cursor[target] += 1
+    return offsets, sources
+
+
+def _set_bits(data, base=0):
+    """Node ids of the set bits of a little-endian bitmap starting at node base."""
+    if np is not None:
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+        return (np.flatnonzero(bits) + base).tolist()
+    nodes = []
+    for i, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            nodes.append(base + 8 * i + low.bit_length() - 1)
+            byte ^= low
+    return nodes
+
+
+def _layout(node_count, workers):
+    size = (node_count + 7) // 8
+    parents_at = (size * (2 + workers) + 7) & ~7
+    return size, parents_at, parents_at + 8 * node_count
+
+
+def _share(state, name):
+    """Point this process at the BFS state and attach the shared block."""
+    global _state, _block
+    _state = state
+    _release()
+    _block = attach(name)
+
+
+def _release():
+    global _block
+    if _block is not None:
+        _block.close()
+        _block = None
+
+
+def _reset():
+    global _state
+    _state = None
+    _release()
+
+
+def _expand(task):
+    """Discover the next-level nodes of one worker; returns how many."""
+    worker, bottom_up = task
+    state = _state
+    low, high = state["ranges"][worker]
+    size, parents_at, _ = _layout(state["node_count"], state["workers"])
+    buffer = _block.buf
+    frontier = buffer[:size]
+    visited = buffer[size:2 * size]
+    mine = buffer[(2 + worker) * size:(3 + worker) * size]
+    parents = buffer[parents_at:parents_at + 8 * state["node_count"]].cast("q")
+    found = 0
+    try:
+        if bottom_up:
+            offsets, sources = state["in_offsets"], state["in_sources"]
+            unvisited = bytes(~byte & 0xFF for byte in visited[low >> 3:(high + 7) >> 3])
+            for node in _set_bits(unvisited, low & ~7):
+                if node >= high:
+                    break
+                for i in range(offsets[node], offsets[node + 1]):
+                    source = sources[i]
+                    if frontier[source >> 3] >> (source & 7) & 1:
+                        mine[node >> 3] |= 1 << (node & 7)
+                        parents[node] = source
+                        found += 1
+                        break
+        else:
+            offsets, targets = state["offsets"], state["targets"]
+            for node in _set_bits(frontier[low >> 3:(high + 7) >> 3], low & ~7):
+                if node >= high:
+                    break
+                for i in range(offsets[node], offsets[node + 1]):
+                    target = targets[i]
+                    byte, bit = target >> 3, 1 << (target & 7)
+                    if not (visited[byte] & bit or mine[byte] & bit):
+                        mine[byte] |= bit
+                        # Another worker may claim the same node in this
+                        # level; either parent is a valid BFS parent.
+                        parents[target] = node
+                        found += 1
+    finally:
+        for view in (frontier, visited, mine, parents):
+            view.release()
+    return found
+
+
+def parallel_bfs(graph, source, processes=None, reverse=None):
+    """Return (distances, parents) arrays by node id; -1 where unreached.
+
+    reverse is reverse_csr(graph), built on the fly when not given.
+    """
+    processes = processes or os.cpu_count()
+    node_count = graph.node_count
+    if reverse is None:
+        reverse = reverse_csr(graph)
+    # Ranges start on a byte boundary so no two workers share a byte.
+    step = ((node_count + processes - 1) // processes + 7) & ~7
+    ranges = [(start, min(start + step, node_count)) for start in range(0, node_count, step)] or [(0, 0)]
+    workers = len(ranges)
+    state = {"node_count": node_count, "workers": workers, "ranges": ranges,
+             "offsets": graph.offsets, "targets": graph.targets,
+             "in_offsets": reverse[0], "in_sources": reverse[1]}
+
+    size, parents_at, total = _layout(node_count, workers)
+    block = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    pool = None
+    try:
+        buffer = block.buf
+        buffer[:total] = bytes(total)
+        buffer[parents_at:total] = (array("q", [-1]) * node_count).tobytes()
+        parents_view = buffer[parents_at:total].cast("q")
+
+        if workers > 1:
+            pool = make_pool(workers, _share, (state, block.name))
+        else:
+            _share(state, block.name)
+
+        distances = array("q", [-1]) * node_count
+        distances[source] = 0
+        visited = frontier = 1 << source
+        frontier_nodes = [source]
+        unexplored_edges = graph.edge_count
+        bottom_up = False
+        level = 0
+        while frontier_nodes:
+            frontier_edges = sum(graph.offsets[node + 1] - graph.offsets[node] for node in frontier_nodes)
+            unexplored_edges -= frontier_edges
+            if not bottom_up and frontier_edges > unexplored_edges / ALPHA:
+                bottom_up = True
+            elif bottom_up and len(frontier_nodes) < node_count / BETA:
+                bottom_up = False
+            buffer[:size] = frontier.to_bytes(size, "little")
+            buffer[size:2 * size] = visited.to_bytes(size, "little")
+
+            tasks = [(worker, bottom_up) for worker in range(workers)]
+            if pool is not None:
+                pool.map(_expand, tasks)
+            else:
+                for task in tasks:
+                    _expand(task)
+
+            found = 0
+            for worker in range(workers):
+                start = (2 + worker) * size
+                found |= int.from_bytes(buffer[start:start + size], "little")
+                buffer[start:start + size] = bytes(size)
+            frontier = found & ~visited
+            visited |= frontier
+            level += 1
+            frontier_nodes = _set_bits(frontier.to_bytes(size, "little"))
+            for node in frontier_nodes:
+                distances[node] = level
+        parents = array("q", parents_view)
+        parents_view.release()
+        del buffer
+    finally:
+        if pool is not None:
+            pool.terminate()
+        _reset()
+        block.close()
+        block.unlink()
+    return distances, parents
+
+
+def benchmark(nodes=200000, edges=2000000):
+    graph = random_csr(nodes, edges, seed=1, weighted=False)
+    reverse = reverse_csr(graph)
+    start = time.perf_counter()
+    expected = bfs(graph, 0).distances
+    sequential = time.perf_counter() - start
+    print("breadth_first.bfs        %.3fs" % sequential)
+    for processes in range(1, os.cpu_count() + 1):
+        start = time.perf_counter()
+        distances, _ = parallel_bfs(graph, 0, processes, reverse)
+        elapsed = time.perf_counter() - start
+        assert {node: distance for node, distance in enumerate(distances) if distance >= 0} == expected
+        print("parallel_bfs x%-3d       %.3fs  speedup %.2fx" % (processes, elapsed, sequential / elapsed))
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,201 @@
+"""Single source, single target shortest paths: bidirectional Dijkstra and A*.
+
+Plain Dijkstra settles every node closer than the target. Bidirectional
+Dijkstra grows two balls, one from each end, that meet in the middle;
+A* steers one search towards the target with a lower bound on the
+remaining distance. Both give the same cost as shortest_paths and return
+one shortest path.
+
+Run from the repository root for settled-node counts and latency:
+
+    python -m algorithms.point_to_point
+"""
+from collections import namedtuple
+import heapq
+from itertools import count
+import math
+import random
+import time
+
+from algorithms.shortest_paths import find_path, infinity, shortest_paths
+
+Route = namedtuple("Route", "cost path settled")
+
+
+def reverse_graph(graph):
+    """Return the dict-of-dicts graph with every edge turned around."""
+    reverse = {node: {} for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor, weight in neighbors.items():
+            reverse.setdefault(neighbor, {})[node] = weight
+    return reverse
+
+
+def bidirectional_dijkstra(graph, source, target, reverse=None):
+    """Dijkstra from both ends at once, stopping when the searches meet.
+
+    Pass reverse=reverse_graph(graph) to reuse it across many queries.
+    """
+    if source == target:
+        return Route(0, [source], 0)
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    order = count()
+    sides = []
+    for start, edges in ((source, graph), (target, reverse)):
+        sides.append({"edges": edges, "costs": {start: 0}, "parents": {start: None},
+                      "settled": set(), "heap": [(0, next(order), start)]})
+    forward, backward = sides
+    best = infinity
+    meeting = None
+
+    while forward["heap"] and backward["heap"]:
+        # Once the two smallest keys add up to the best path found, no
+        # shorter path can still be discovered.
+        if forward["heap"][0][0] + backward["heap"][0][0] >= best:
+            break
+        side, other = (forward, backward) if forward["heap"][0][0] <= backward["heap"][0][0] \
+            else (backward, forward)
+        cost, _, node = heapq.heappop(side["heap"])
+        if node in side["settled"]:
+            continue
+        side["settled"].add(node)
+        for neighbor, weight in side["edges"].get(node, {}).items():
+            new_cost = cost + weight
+            if new_cost < side["costs"].get(neighbor, infinity):
+                side["costs"][neighbor] = new_cost
+                side["parents"][neighbor] = node
+                heapq.heappush(side["heap"], (new_cost, next(order), neighbor))
+            through = new_cost + other["costs"].get(neighbor, infinity)
+            if through < best:
+                best = through
+                meeting = neighbor
+
+    settled = len(forward["settled"]) + len(backward["settled"])
+    if meeting is None:
+        return Route(infinity, None, settled)
+    path = find_path(forward["parents"], meeting)
+    node = backward["parents"][meeting]
+    while node is not None:
+        path.append(node)
+        node = backward["parents"][node]
+    return Route(best, path, settled)
+
+
+def astar(graph, source, target, heuristic=None):
+    """A* search; heuristic(node) must never overestimate the cost to target.
+
+    A node is expanded again if a cheaper path to it turns up later, so
+    an admissible but inconsistent heuristic still gives exact costs; a
+    consistent one (such as euclidean_heuristic) never triggers that.
+    Without a heuristic this is plain Dijkstra with early exit.
+    """
+    if heuristic is None:
+        heuristic = lambda node: 0
+    costs = {source: 0}
+    parents = {source: None}
+    settled = set()
+    order = count()
+    heap = [(heuristic(source), next(order), 0, source)]
+    while heap:
+        _, _, cost, node = heapq.heappop(heap)
+        if cost > costs[node]:
+            continue
+        settled.add(node)
+        if node == target:
+            return Route(cost, find_path(parents, target), len(settled))
+        for neighbor, weight in graph.get(node, {}).items():
+            new_cost = cost + weight
+            if new_cost < costs.get(neighbor, infinity):
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(heap, (new_cost + heuristic(neighbor), next(order),
+                                      new_cost, neighbor))
+    return Route(infinity, None, len(settled))
+
+
+def euclidean_heuristic(coordinates, target, scale=1.0):
+    """Straight-line distance to target from a {node: (x, y)} table.
+
+    Admissible, and consistent, as long as no edge costs less than scale
+    times the distance between its end points.
+    """
+    target_x, target_y = coordinates[target]
+
+    def heuristic(node):
+        x, y = coordinates[node]
+        return scale * math.hypot(x - target_x, y - target_y)
+
+    return heuristic
+
+
+def grid_graph(width, height, max_weight=10, seed=None):
+    """Grid with random weights of at least 1 between 4-neighbours, plus coordinates."""
+    rng = random.Random(seed)
+    graph = {}
+    coordinates = {}
+    for x in range(width):
+        for y in range(height):
+            graph[(x, y)] = {}
+            coordinates[(x, y)] = (x, y)
+    for (x, y) in coordinates:
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            neighbor = (x + dx, y + dy)
+            if neighbor in graph:
+                graph[(x, y)][neighbor] = rng.randint(1, max_weight)
+    return graph, coordinates
+
+
+def road_graph(width, height, seed=None):
+    """Jittered grid with missing streets and sparse fast highways.
+
+    Edge costs are travel times: street length divided by a speed of 1,
+    or 2 on highways, so the heuristic needs scale=0.5.
+    """
+    rng = random.Random(seed)
+    coordinates = {(x, y): (x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3))
+                   for x in range(width) for y in range(height)}
+    graph = {node: {} for node in coordinates}
+
+    def connect(a, b, speed):
+        (ax, ay), (bx, by) = coordinates[a], coordinates[b]
+        cost = math.hypot(ax - bx, ay - by) / speed
+        graph[a][b] = graph[b][a] = cost
+
+    for (x, y) in coordinates:
+        for neighbor in ((x + 1, y), (x, y + 1)):
+            if neighbor in graph and rng.random() > 0.15:
+                connect((x, y), neighbor, 1.0)
+    for y in range(0, height, 10):
+        for x in range(width - 1):
+            connect((x, y), (x + 1, y), 2.0)
+    for x in range(0, width, 10):
+        for y in range(height - 1):
+            connect((x, y), (x, y + 1), 2.0)
+    return graph, coordinates
+
+
+def benchmark(queries=20, seed=1):
+    rng = random.Random(seed)
+    for label, (graph, coordinates), scale in (("grid 100x100", grid_graph(100, 100, seed=seed), 1.0),
+                                               ("road 100x100", road_graph(100, 100, seed=seed), 0.5)):
+        reverse = reverse_graph(graph)
+        nodes = list(graph)
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+        expected = [shortest_paths(graph, s, t)[0].get(t, infinity) for s, t in pairs]
+        print(label)
+        for name, run in (
+                ("dijkstra", lambda s, t: astar(graph, s, t)),
+                ("bidirectional", lambda s, t: bidirectional_dijkstra(graph, s, t, reverse)),
+                ("a*", lambda s, t: astar(graph, s, t, euclidean_heuristic(coordinates, t, scale)))):
+            start = time.perf_counter()
+            routes = [run(s, t) for s, t in pairs]
+            elapsed = time.perf_counter() - start
+            for route, cost in zip(routes, expected):
+                assert math.isclose(route.cost, cost), (name, route.cost, cost)
+            print("  %-14s %9.0f settled/query %9.2f ms/query"
+                  % (name, sum(route.settled for route in routes) / queries, 1000 * elapsed / queries))
+
+
+if __name__ == "__main__":
+    benchmark()
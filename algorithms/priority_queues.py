@@ -0,0 +1,235 @@
+"""Priority queues over integer node ids with a real decrease_key.
+
+heapq with lazy deletion pushes a new entry on every improvement and
+leaves the old one behind, so on graphs where costs improve many times
+the heap fills with stale entries. Both queues here hold each node at
+most once and update its key in place. They keep their state in flat
+arrays indexed by node id, sized once for the whole graph.
+
+Run from the repository root to compare them inside Dijkstra:
+
+    python -m algorithms.priority_queues
+"""
+from array import array
+import time
+
+from algorithms.random_graphs import random_csr
+from algorithms.shortest_paths import csr_shortest_paths, infinity
+
+
+class IndexedBinaryHeap:
+    """Binary min-heap of node ids 0..capacity-1 with a position index."""
+
+    def __init__(self, capacity):
+        self.keys = array("d", [infinity]) * capacity
+        self.heap = array("q", [0]) * capacity
+        self.position = array("q", [-1]) * capacity
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, node):
+        return self.position[node] >= 0
+
+    def push(self, node, key):
+        if self.position[node] >= 0:
+            raise ValueError("node %r is already queued" % node)
+        self.keys[node] = key
+        self.heap[self.size] = node
+        self.position[node] = self.size
+        self.size += 1
+        self._sift_up(self.size - 1)
+
+    def decrease_key(self, node, key):
+        if self.position[node] < 0:
+            raise KeyError(node)
+        if key > self.keys[node]:
+            raise ValueError("new key %r is larger than the current key %r" % (key, self.keys[node]))
+        self.keys[node] = key
+        self._sift_up(self.position[node])
+
+    def pop(self):
+        """Remove and return (node, key) with the smallest key."""
+        if not self.size:
+            raise IndexError("pop from an empty heap")
+        heap = self.heap
+        node = heap[0]
+        self.size -= 1
+        last = heap[self.size]
+        self.position[node] = -1
+        if self.size:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return node, self.keys[node]
+
+    def _sift_up(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        node = heap[i]
+        key = keys[node]
+        while i:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if keys[above] <= key:
+                break
+            heap[i] = above
+            position[above] = i
+            i = parent
+        heap[i] = node
+        position[node] = i
+
+    def _sift_down(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = self.size
+        node = heap[i]
+        key = keys[node]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            below = heap[child]
+            if key <= keys[below]:
+                break
+            heap[i] = below
+            position[below] = i
+            i = child
+        heap[i] = node
+        position[node] = i
+
+
+class PairingHeap:
+    """Pairing heap of node ids 0..capacity-1, stored as linked arrays.
+
+    prev[node] is the parent for a leftmost child and the left sibling
+    otherwise, which is what decrease_key needs to cut a subtree out in
+    O(1).
+    """
+
+    def __init__(self, capacity):
+        self.keys = array("d", [infinity]) * capacity
+        self.child = array("q", [-1]) * capacity
+        self.sibling = array("q", [-1]) * capacity
+        self.prev = array("q", [-1]) * capacity
+        self.queued = bytearray(capacity)
+        self.root = -1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, node):
+        return self.queued[node] == 1
+
+    def _meld(self, a, b):
+        if self.keys[b] < self.keys[a]:
+            a, b = b, a
+        first = self.child[a]
+        self.sibling[b] = first
+        if first != -1:
+            self.prev[first] = b
+        self.prev[b] = a
+        self.child[a] = b
+        return a
+
+    def push(self, node, key):
+        if self.queued[node]:
+            raise ValueError("node %r is already queued" % node)
+        self.keys[node] = key
+        self.child[node] = self.sibling[node] = self.prev[node] = -1
+        self.queued[node] = 1
+        self.size += 1
+        self.root = node if self.root == -1 else self._meld(self.root, node)
+
+    def decrease_key(self, node, key):
+        if not self.queued[node]:
+            raise KeyError(node)
+        if key > self.keys[node]:
+            raise ValueError("new key %r is larger than the current key %r" % (key, self.keys[node]))
+        self.keys[node] = key
+        if node == self.root:
+            return
+        before = self.prev[node]
+        after = self.sibling[node]
+        if self.child[before] == node:
+            self.child[before] = after
+        else:
+            self.sibling[before] = after
+        if after != -1:
+            self.prev[after] = before
+        self.sibling[node] = self.prev[node] = -1
+        self.root = self._meld(self.root, node)
+
+    def pop(self):
+        """Remove and return (node, key) with the smallest key."""
+        node = self.root
+        if node == -1:
+            raise IndexError("pop from an empty heap")
+        self.queued[node] = 0
+        self.size -= 1
+        # Two-pass pairing: meld children pairwise left to right, then
+        # fold the results together right to left.
+        pairs = []
+        current = self.child[node]
+        while current != -1:
+            second = self.sibling[current]
+            if second == -1:
+                self.prev[current] = self.sibling[current] = -1
+                pairs.append(current)
+                break
+            following = self.sibling[second]
+            self.prev[current] = self.sibling[current] = -1
+            self.prev[second] = self.sibling[second] = -1
+            pairs.append(self._meld(current, second))
+            current = following
+        root = -1
+        for tree in reversed(pairs):
+            root = tree if root == -1 else self._meld(root, tree)
+        self.root = root
+        return node, self.keys[node]
+
+
+def dijkstra(graph, source, queue_type=IndexedBinaryHeap):
+    """Dijkstra on a CSRGraph by node id using an indexed queue.
+
+    Returns costs and parents like csr_shortest_paths.
+    """
+    costs = [infinity] * graph.node_count
+    parents = array("q", [-1]) * graph.node_count
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    queue = queue_type(graph.node_count)
+    costs[source] = 0
+    queue.push(source, 0)
+    while queue:
+        node, cost = queue.pop()
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            new_cost = cost + (weights[i] if weights is not None else 1)
+            if new_cost < costs[neighbor]:
+                if neighbor in queue:
+                    queue.decrease_key(neighbor, new_cost)
+                else:
+                    queue.push(neighbor, new_cost)
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+    return costs, parents
+
+
+def benchmark():
+    for label, nodes, edges in (("sparse", 100000, 400000), ("dense", 1000, 400000)):
+        graph = random_csr(nodes, edges, seed=1)
+        print("%s: %d nodes, %d edges" % (label, nodes, edges))
+        expected, _ = csr_shortest_paths(graph, 0)
+        for name, run in (("heapq, lazy deletion", lambda: csr_shortest_paths(graph, 0)),
+                          ("indexed binary heap", lambda: dijkstra(graph, 0, IndexedBinaryHeap)),
+                          ("pairing heap", lambda: dijkstra(graph, 0, PairingHeap))):
+            start = time.perf_counter()
+            costs, _ = run()
+            print("  %-22s %.3fs" % (name, time.perf_counter() - start))
+            assert costs == expected
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,7 +1,9 @@
 import big_o
+from algorithms.integer_sort import counting_sort, integer_sort, radix_sort
+from algorithms.introsort import introsort
 
 def quick_sort(array):
-    if len(array) <= 2:
+    if len(array) < 2:
         return array
     else:
         pivot = array[0]
@@ -10,4 +12,23 @@ def quick_sort(array):
 
     return quick_sort(less) + [pivot] + quick_sort(greater)
 
-print(quick_sort([5,8,9,2,3,1]))
\ No newline at end of file
+print(quick_sort([5,8,9,2,3,1]))
+
+
+def introsort_copy(array):
+    array = list(array)
+    introsort(array)
+    return array
+
+positive_int_generator = lambda n: big_o.datagen.integers(n, 0, 10000)
+for name, func in (("quick_sort", quick_sort), ("introsort", introsort_copy),
+                   ("sorted", sorted), ("counting_sort", counting_sort),
+                   ("radix_sort", radix_sort), ("integer_sort", integer_sort)):
+    best, others = big_o.big_o(func, positive_int_generator, max_n=10000, n_repeats=3)
+    print(name, best)
+
+# Already sorted input: array[0] is always the smallest value, so quick_sort
+# recurses n levels deep, while introsort stays O(n log n).
+sorted_int_generator = lambda n: sorted(positive_int_generator(n))
+best, others = big_o.big_o(introsort_copy, sorted_int_generator, max_n=10000, n_repeats=3)
+print("introsort on sorted input", best)
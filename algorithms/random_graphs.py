@@ -0,0 +1,71 @@
+"""Seeded random graphs shared by the graph tests and benchmarks.
+
+seed may be anything random.Random accepts, or a random.Random to draw
+from, so a test can build a graph and its queries from one generator.
+"""
+from array import array
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from algorithms.csr_graph import CSRGraph, ID_TYPECODE, OFFSET_TYPECODE, WEIGHT_TYPECODE
+
+
+def _rng(seed):
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+
+def random_adjacency(nodes, edges, seed=None):
+    """{node: [neighbor, ...]} over ids 0..nodes-1; loops and repeats allowed."""
+    rng = _rng(seed)
+    graph = {node: [] for node in range(nodes)}
+    for _ in range(edges):
+        graph[rng.randrange(nodes)].append(rng.randrange(nodes))
+    return graph
+
+
+def random_weighted(nodes, edges, seed=None, weights=(1, 10), loops=True):
+    """{node: {neighbor: weight}} with integer weights drawn from the weights range.
+
+    A repeated pair keeps its last weight, so there can be fewer than
+    edges edges; loops=False leaves out edges from a node to itself.
+    """
+    rng = _rng(seed)
+    low, high = weights
+    graph = {node: {} for node in range(nodes)}
+    for _ in range(edges):
+        source, target = rng.randrange(nodes), rng.randrange(nodes)
+        if loops or source != target:
+            graph[source][target] = rng.randint(low, high)
+    return graph
+
+
+def random_csr(nodes, edges, seed=None, max_weight=100.0, weighted=True, numpy=False):
+    """Random CSRGraph with uniform weights in [1, max_weight].
+
+    numpy=True generates the buffers as numpy arrays in bulk, which keeps
+    graphs of 1e7 edges cheap for the vectorized algorithms; its draws
+    differ from the array.array ones for the same seed.
+    """
+    if numpy:
+        rng = np.random.default_rng(seed)
+        sources = np.sort(rng.integers(0, nodes, edges))
+        offsets = np.searchsorted(sources, np.arange(nodes + 1)).astype(np.int64)
+        targets = rng.integers(0, nodes, edges).astype(np.int32)
+        weights = rng.uniform(1.0, max_weight, edges) if weighted else None
+        return CSRGraph(range(nodes), offsets, targets, weights)
+
+    rng = _rng(seed)
+    pairs = sorted((rng.randrange(nodes), rng.randrange(nodes)) for _ in range(edges))
+    offsets = array(OFFSET_TYPECODE, [0]) * (nodes + 1)
+    for source, _ in pairs:
+        offsets[source + 1] += 1
+    for node in range(nodes):
+        offsets[node + 1] += offsets[node]
+    weights = (array(WEIGHT_TYPECODE, (rng.uniform(1, max_weight) for _ in pairs))
+               if weighted else None)
+    return CSRGraph(range(nodes), offsets, array(ID_TYPECODE, (target for _, target in pairs)),
+                    weights)
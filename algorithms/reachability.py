@@ -0,0 +1,267 @@
+"""Reachability index answering "can X reach Y" without a search per query.
+
+Strongly connected components are condensed first, which turns any
+graph into a DAG. Every component then gets GRAIL labels: for each of a
+few randomized DFS traversals, the interval [low, rank] where rank is
+the post-order number and low the smallest rank below it. If X reaches
+Y, Y's interval lies inside X's in every traversal, so a failed
+containment answers "no" in O(traversals). When all intervals contain
+each other, a DFS that only enters components whose labels still
+contain Y's decides.
+
+Run from the repository root for build time, size and query latency:
+
+    python -m algorithms.reachability [nodes] [edges]
+"""
+from array import array
+import random
+import sys
+import time
+
+from algorithms.breadth_first import bfs
+from algorithms.csr_graph import CSRGraph
+
+
+class ReachabilityIndex:
+    """Index over a dict-of-lists, dict-of-dicts or CSRGraph; accepts new edges."""
+
+    def __init__(self, graph, traversals=3, seed=None):
+        if isinstance(graph, CSRGraph):
+            graph = graph.to_adjacency()
+        self.traversals = traversals
+        self._random = random.Random(seed)
+        self.names = []
+        self.ids = {}
+        self.adjacency = []
+        for name, neighbors in graph.items():
+            node = self._intern(name)
+            for neighbor in neighbors:
+                self.adjacency[node].add(self._intern(neighbor))
+        self.build()
+
+    def _intern(self, name):
+        node = self.ids.get(name)
+        if node is None:
+            node = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.adjacency.append(set())
+        return node
+
+    def build(self):
+        """(Re)build components and labels from the current edges."""
+        started = time.perf_counter()
+        self.component = self._strongly_connected_components()
+        count = max(self.component, default=-1) + 1
+        self.dag = [set() for _ in range(count)]
+        self.reverse_dag = [set() for _ in range(count)]
+        for node, neighbors in enumerate(self.adjacency):
+            for neighbor in neighbors:
+                a, b = self.component[node], self.component[neighbor]
+                if a != b:
+                    self.dag[a].add(b)
+                    self.reverse_dag[b].add(a)
+        self.low = []
+        self.high = []
+        for _ in range(self.traversals):
+            low, high = self._label()
+            self.low.append(low)
+            self.high.append(high)
+        self._next_rank = count
+        self.build_seconds = time.perf_counter() - started
+
+    def _strongly_connected_components(self):
+        # Iterative Tarjan: recursion would overflow on long paths.
+        adjacency = self.adjacency
+        size = len(adjacency)
+        index = array("q", [-1]) * size
+        lowlink = array("q", [0]) * size
+        component = array("q", [-1]) * size
+        on_stack = bytearray(size)
+        stack = []
+        counter = 0
+        components = 0
+        for root in range(size):
+            if index[root] >= 0:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, iter(adjacency[root]))]
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if index[neighbor] < 0:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, iter(adjacency[neighbor])))
+                        break
+                    if on_stack[neighbor]:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            component[member] = components
+                            if member == node:
+                                break
+                        components += 1
+        return component
+
+    def _label(self):
+        """One randomized post-order traversal of the DAG: (low, rank) arrays."""
+        count = len(self.dag)
+        low = array("q", [0]) * count
+        rank = array("q", [0]) * count
+        visited = bytearray(count)
+        shuffle = self._random.shuffle
+        roots = list(range(count))
+        shuffle(roots)
+        next_rank = 0
+        for root in roots:
+            if visited[root]:
+                continue
+            visited[root] = 1
+            children = list(self.dag[root])
+            shuffle(children)
+            work = [(root, iter(children))]
+            while work:
+                component, children = work[-1]
+                for child in children:
+                    if not visited[child]:
+                        visited[child] = 1
+                        grandchildren = list(self.dag[child])
+                        shuffle(grandchildren)
+                        work.append((child, iter(grandchildren)))
+                        break
+                else:
+                    work.pop()
+                    rank[component] = next_rank
+                    smallest = next_rank
+                    for child in self.dag[component]:
+                        if low[child] < smallest:
+                            smallest = low[child]
+                    low[component] = smallest
+                    next_rank += 1
+        return low, rank
+
+    def _contains(self, outer, inner):
+        for low, high in zip(self.low, self.high):
+            if low[inner] < low[outer] or high[inner] > high[outer]:
+                return False
+        return True
+
+    def _component_reaches(self, source, target):
+        if source == target:
+            return True
+        if not self._contains(source, target):
+            return False
+        # Labels could not rule it out: search, pruning every component
+        # whose labels do not contain target's.
+        seen = {source}
+        stack = [source]
+        while stack:
+            component = stack.pop()
+            for child in self.dag[component]:
+                if child == target:
+                    return True
+                if child not in seen and self._contains(child, target):
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+    def reaches(self, source, target):
+        """True if there is a path from source to target (a node reaches itself)."""
+        try:
+            a, b = self.ids[source], self.ids[target]
+        except KeyError:
+            return source == target
+        return self._component_reaches(self.component[a], self.component[b])
+
+    def add_edge(self, source, target):
+        """Insert source -> target, updating labels in place.
+
+        An edge that closes a cycle merges components and rebuilds the
+        index; any other edge only widens the intervals of source's
+        component and its ancestors to cover target's.
+        """
+        for name in (source, target):
+            if name not in self.ids:
+                self._add_node(name)
+        a, b = self.ids[source], self.ids[target]
+        self.adjacency[a].add(b)
+        ca, cb = self.component[a], self.component[b]
+        if ca == cb or cb in self.dag[ca]:
+            return
+        if self._component_reaches(cb, ca):
+            self.build()
+            return
+        self.dag[ca].add(cb)
+        self.reverse_dag[cb].add(ca)
+        for low, high in zip(self.low, self.high):
+            stack = [ca]
+            while stack:
+                component = stack.pop()
+                if low[cb] >= low[component] and high[cb] <= high[component]:
+                    continue
+                low[component] = min(low[component], low[cb])
+                high[component] = max(high[component], high[cb])
+                stack.extend(self.reverse_dag[component])
+
+    def _add_node(self, name):
+        self._intern(name)
+        self.component.append(len(self.dag))
+        self.dag.append(set())
+        self.reverse_dag.append(set())
+        for low, high in zip(self.low, self.high):
+            low.append(self._next_rank)
+            high.append(self._next_rank)
+        self._next_rank += 1
+
+    def stats(self):
+        """Build time and the size of the labels and component map."""
+        index_bytes = self.component.itemsize * len(self.component)
+        for labels in self.low + self.high:
+            index_bytes += labels.itemsize * len(labels)
+        return {
+            "nodes": len(self.names),
+            "components": len(self.dag),
+            "dag_edges": sum(len(children) for children in self.dag),
+            "build_seconds": self.build_seconds,
+            "index_bytes": index_bytes,
+        }
+
+
+def benchmark(nodes=20000, edges=60000, queries=2000):
+    rng = random.Random(1)
+    # Edges mostly go from lower to higher ids: DAG-shaped with a few cycles.
+    graph = {node: [] for node in range(nodes)}
+    for _ in range(edges):
+        a, b = sorted(rng.sample(range(nodes), 2))
+        if rng.random() < 0.01:
+            a, b = b, a
+        graph[a].append(b)
+    index = ReachabilityIndex(graph, seed=1)
+    print(index.stats())
+    pairs = [(rng.randrange(nodes), rng.randrange(nodes)) for _ in range(queries)]
+    start = time.perf_counter()
+    answers = [index.reaches(a, b) for a, b in pairs]
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    sample = pairs[:100]
+    expected = [b in bfs(graph, a).distances for a, b in sample]
+    searched = time.perf_counter() - start
+    assert answers[:100] == expected
+    print("index %.1f us/query, bfs %.1f us/query, %.0f%% reachable"
+          % (1e6 * indexed / queries, 1e6 * searched / len(sample), 100 * sum(answers) / queries))
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
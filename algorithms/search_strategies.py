@@ -0,0 +1,166 @@
+"""Binary, interpolation and exponential (galloping) search over sorted data.
+
+Every strategy returns the index of the leftmost occurrence of target,
+or -1 when target is not present.
+"""
+from bisect import bisect_left
+from itertools import islice
+from numbers import Real
+
+
+def _plain(value):
+    # numpy scalars do fixed-width arithmetic; .item() gives the Python
+    # int or float, so the position arithmetic below cannot overflow.
+    return value.item() if hasattr(value, "item") else value
+
+
+def binary_search(array, target, low=0, high=None):
+    if high is None:
+        high = len(array)
+    position = bisect_left(array, target, low, high)
+    if position < high and array[position] == target:
+        return position
+    return -1
+
+
+def interpolation_search(array, target):
+    """Probe where target should be if the keys were evenly spread.
+
+    Needs about log2(log2(n)) probes on uniform keys. Skewed keys can
+    make it crawl, so after a few probes that barely shrink the range it
+    hands the rest over to binary search.
+    """
+    low = 0
+    high = len(array) - 1
+    slow_probes = 0
+    while low <= high and array[low] <= target <= array[high]:
+        if array[high] == array[low]:
+            return low if array[low] == target else -1
+        width = high - low
+        first, last = _plain(array[low]), _plain(array[high])
+        mid = low + int((_plain(target) - first) * width / (last - first))
+        if array[mid] < target:
+            low = mid + 1
+        elif array[mid] > target:
+            high = mid - 1
+        else:
+            high = mid
+        if high - low > width // 2:
+            slow_probes += 1
+            if slow_probes > 2:
+                return binary_search(array, target, low, high + 1)
+    if low < len(array) and low <= high and array[low] == target:
+        return low
+    return -1
+
+
+def exponential_search(array, target):
+    """Gallop 1, 2, 4, ... to bracket target, then binary search the bracket.
+
+    Costs O(log i) where i is the position of target, which beats plain
+    binary search when hits are close to the front.
+    """
+    if not len(array):
+        return -1
+    bound = 1
+    while bound < len(array) and array[bound] < target:
+        bound *= 2
+    return binary_search(array, target, bound // 2, min(bound + 1, len(array)))
+
+
+def galloping_search(source, target, max_chunk=1 << 16):
+    """Exponential search over an iterator or a sequence of unknown length.
+
+    A sequence is only indexed, never asked for its len(), so anything
+    that raises IndexError past its end works. An iterator is consumed in
+    chunks that double in size up to max_chunk; only the current chunk is
+    kept in memory and the stream is left just past it.
+    """
+    if not hasattr(source, "__getitem__"):
+        return _gallop_stream(iter(source), target, max_chunk)
+
+    def probe(i):
+        try:
+            return source[i]
+        except IndexError:
+            return None
+
+    bound = 1
+    value = probe(0)
+    if value is None:
+        return -1
+    while True:
+        value = probe(bound)
+        if value is None or value >= target:
+            break
+        bound *= 2
+    low, high = bound // 2, bound
+    # First index in [low, high] whose value is >= target; off the end
+    # counts as +infinity.
+    while low < high:
+        mid = (low + high) // 2
+        value = probe(mid)
+        if value is not None and value < target:
+            low = mid + 1
+        else:
+            high = mid
+    value = probe(low)
+    return low if value is not None and value == target else -1
+
+
+def _gallop_stream(iterator, target, max_chunk):
+    offset = 0
+    size = 1
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return -1
+        if chunk[-1] >= target:
+            position = binary_search(chunk, target)
+            return offset + position if position >= 0 else -1
+        offset += len(chunk)
+        size = min(size * 2, max_chunk)
+
+
+def choose_strategy(array, sample_size=32, tolerance=0.1):
+    """Sample the keys and pick the strategy that should need fewest probes.
+
+    Interpolation wins when evenly spaced samples lie close to the line
+    from the first key to the last one; anything else gets binary search.
+    """
+    size = len(array)
+    if size < 2 * sample_size or not isinstance(array[0], Real):
+        return "binary"
+    first, last = _plain(array[0]), _plain(array[-1])
+    if last == first:
+        return "binary"
+    step = (size - 1) / (sample_size - 1)
+    worst = 0.0
+    for i in range(sample_size):
+        index = int(i * step)
+        expected = first + (last - first) * index / (size - 1)
+        worst = max(worst, abs(_plain(array[index]) - expected) / (last - first))
+    return "interpolation" if worst <= tolerance else "binary"
+
+
+STRATEGIES = {
+    "binary": binary_search,
+    "interpolation": interpolation_search,
+    "exponential": exponential_search,
+    "galloping": galloping_search,
+}
+
+
+def make_searcher(array, strategy="auto"):
+    """Return search(target) bound to array, sampling it once for 'auto'."""
+    if strategy == "auto":
+        strategy = choose_strategy(array)
+    try:
+        func = STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError("unknown search strategy %r" % (strategy,)) from None
+    return lambda target: func(array, target)
+
+
+def search(array, target, strategy="auto"):
+    return make_searcher(array, strategy)(target)
@@ -1,5 +1,6 @@
 from array import array
 import big_o
+from algorithms.selection import select, smallest_k, stream_smallest_k
 
 def findSmallest(array):
 
@@ -9,7 +10,6 @@ def findSmallest(array):
         if array[i] < smallest:
             smallest = array[i]
             smallest_index = i
-        print(i)
 
     return smallest_index
 
@@ -23,6 +23,18 @@ def selectionSort(array):
 
 
 print(selectionSort([5,8,4,9]))
+print(smallest_k([5,8,4,9], 2))
+print(stream_smallest_k(iter([5,8,4,9]), 2))
+print(select([5,8,4,9], 1))
 #positive_int_generator = lambda n: big_o.datagen.integers(n, 0, 10)
 #best, others = big_o.big_o(selectionSort, positive_int_generator, n_repeats=1)
 #print(best)
+
+# Only the 10 smallest: selectionSort still sorts everything, the partial
+# selections stop early.
+positive_int_generator = lambda n: big_o.datagen.integers(n, 0, 10000)
+for name, func in (("smallest_k", lambda array: smallest_k(array, 10)),
+                   ("stream_smallest_k", lambda array: stream_smallest_k(array, 10)),
+                   ("select", lambda array: select(array, 10))):
+    best, others = big_o.big_o(func, positive_int_generator, n_repeats=10)
+    print(name, best)
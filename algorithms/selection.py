@@ -0,0 +1,99 @@
+"""Partial selection: the k smallest items or the k-th smallest item.
+
+Cheaper than sorting everything when only a few items are needed:
+O(n + k log n) for smallest_k, O(n log k) with O(k) memory for
+stream_smallest_k and expected O(n) for select.
+"""
+import heapq
+from itertools import count, islice
+
+from algorithms.introsort import SMALL_RANGE, heapsort, insertion_sort, median_of_three, partition3
+
+
+def smallest_k(array, k, key=None):
+    """Return the k smallest items of array in sorted order."""
+    if k <= 0:
+        return []
+    if k >= len(array):
+        return sorted(array, key=key)
+    if key is None:
+        heap = list(array)
+        heapq.heapify(heap)
+        return [heapq.heappop(heap) for _ in range(k)]
+    # The position breaks ties so items themselves are never compared.
+    heap = [(key(item), i, item) for i, item in enumerate(array)]
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[2] for _ in range(k)]
+
+
+class _Largest:
+    """Reverses the ordering so heapq's min-heap behaves as a max-heap."""
+
+    __slots__ = ("key", "order", "item")
+
+    def __init__(self, key, order, item):
+        self.key = key
+        self.order = order
+        self.item = item
+
+    def __lt__(self, other):
+        return (other.key, other.order) < (self.key, self.order)
+
+
+def stream_smallest_k(iterable, k, key=None):
+    """Return the k smallest items of any iterable in sorted order.
+
+    Keeps a max-heap of the best k seen so far, so the input is consumed
+    one item at a time and never held in memory.
+    """
+    if k <= 0:
+        return []
+    if key is None:
+        key = lambda item: item
+    iterator = iter(iterable)
+    order = count()
+    heap = [_Largest(key(item), next(order), item) for item in islice(iterator, k)]
+    heapq.heapify(heap)
+    for item in iterator:
+        item_key = key(item)
+        # heap[0] is the largest of the k kept so far.
+        if item_key < heap[0].key:
+            heapq.heapreplace(heap, _Largest(item_key, next(order), item))
+    return [entry.item for entry in sorted(heap, reverse=True)]
+
+
+def select(array, k):
+    """Return the k-th smallest item (k = 0 is the minimum).
+
+    Introselect on a copy: quickselect with a median-of-three pivot and
+    three-way partitioning, falling back to heapsort on the remaining
+    range if partitioning keeps going badly.
+    """
+    if not 0 <= k < len(array):
+        raise IndexError("k=%d out of range for %d items" % (k, len(array)))
+    array = list(array)
+    low, high = 0, len(array)
+    depth = 2 * len(array).bit_length()
+    while high - low > SMALL_RANGE:
+        if depth == 0:
+            heapsort(array, low, high)
+            return array[k]
+        depth -= 1
+        pivot = median_of_three(array[low], array[(low + high) // 2], array[high - 1])
+        less_end, greater_start = partition3(array, low, high, pivot)
+        if k < less_end:
+            high = less_end
+        elif k >= greater_start:
+            low = greater_start
+        else:
+            return pivot
+    insertion_sort(array, low, high)
+    return array[k]
+
+
+def median(array):
+    """Return the median, averaging the two middle items for even sizes."""
+    size = len(array)
+    if size % 2:
+        return select(array, size // 2)
+    return (select(array, size // 2 - 1) + select(array, size // 2)) / 2
@@ -0,0 +1,100 @@
+"""Dijkstra's algorithm on the dict-of-dicts graphs of dijkstras_algorithm.py.
+
+graph[node][neighbor] is the weight of the edge node -> neighbor, and a
+node with no outgoing edges may map to an empty dict or be left out.
+A CSRGraph works too.
+"""
+from array import array
+import heapq
+from itertools import count
+
+from algorithms.csr_graph import CSRGraph
+
+infinity = float("inf")
+
+
+def shortest_paths(graph, source, target=None):
+    """Return (costs, parents) tables for the shortest paths from source.
+
+    Uses a binary heap with lazy deletion: a node may sit in the heap
+    several times and stale entries are skipped once it is visited. With
+    a target the search stops as soon as target is settled; costs of
+    nodes not yet settled by then are upper bounds, not final.
+    """
+    if isinstance(graph, CSRGraph):
+        target_id = graph.id_of(target) if target is not None else -1
+        costs, parents = csr_shortest_paths(graph, graph.id_of(source), target_id)
+        names = graph.names
+        return ({names[node]: cost for node, cost in enumerate(costs) if cost != infinity},
+                {names[node]: names[parent] if parent >= 0 else None
+                 for node, parent in enumerate(parents) if costs[node] != infinity})
+
+    costs = {source: 0}
+    parents = {source: None}
+    visited = set()
+    # The counter breaks cost ties so nodes themselves are never compared.
+    order = count()
+    heap = [(0, next(order), source)]
+    while heap:
+        cost, _, node = heapq.heappop(heap)
+        if node in visited:
+            continue
+        visited.add(node)
+        if node == target:
+            break
+        for neighbor, weight in graph.get(node, {}).items():
+            if weight < 0:
+                raise ValueError("negative edge weight %r on %r -> %r" % (weight, node, neighbor))
+            new_cost = cost + weight
+            if new_cost < costs.get(neighbor, infinity):
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(heap, (new_cost, next(order), neighbor))
+    return costs, parents
+
+
+def csr_shortest_paths(graph, source, target=-1):
+    """Dijkstra on a CSRGraph by node id.
+
+    Returns a list of costs (infinity if unreached) and an array of
+    parent ids (-1 for the source and unreached nodes).
+    """
+    costs = [infinity] * graph.node_count
+    parents = array("q", [-1]) * graph.node_count
+    visited = bytearray(graph.node_count)
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    costs[source] = 0
+    heap = [(0, source)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if visited[node]:
+            continue
+        visited[node] = 1
+        if node == target:
+            break
+        for i in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[i]
+            weight = weights[i] if weights is not None else 1
+            if weight < 0:
+                raise ValueError("negative edge weight %r on %r -> %r" % (weight, node, neighbor))
+            new_cost = cost + weight
+            if new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(heap, (new_cost, neighbor))
+    return costs, parents
+
+
+def find_path(parents, target):
+    """Follow parents back from target; return the path or None if unreached."""
+    if target not in parents:
+        return None
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
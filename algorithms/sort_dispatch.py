@@ -0,0 +1,192 @@
+"""Sort front end that looks at a sample of the input before choosing an engine.
+
+Run from the repository root for the benchmark matrix:
+
+    python -m algorithms.sort_dispatch [n]
+"""
+from array import array
+from collections import Counter, namedtuple
+import logging
+from multiprocessing import cpu_count
+from numbers import Integral
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from algorithms.integer_sort import COUNTING_RANGE_FACTOR, integer_sort
+from algorithms.introsort import introsort
+from algorithms.parallel_sort import PARALLEL_THRESHOLD, parallel_sort
+
+logger = logging.getLogger(__name__)
+
+SortProfile = namedtuple("SortProfile", "size integer key_range descent_ratio duplicate_ratio")
+
+
+def profile(values, sample_size=1024, blocks=8):
+    """Estimate size, presortedness, key range and duplicates from a sample.
+
+    The sample is a few contiguous blocks spread over the input, so runs
+    are still visible: descent_ratio is the fraction of neighbouring
+    pairs that go down, near 0 for sorted and near 1 for reversed input.
+    """
+    size = len(values)
+    if size <= sample_size:
+        sample_blocks = [list(values)]
+    else:
+        width = sample_size // blocks
+        step = (size - width) // (blocks - 1)
+        sample_blocks = [list(values[i * step:i * step + width]) for i in range(blocks)]
+    sample = [value for block in sample_blocks for value in block]
+    if not sample:
+        return SortProfile(size, False, None, 0.0, 0.0)
+
+    pairs = sum(len(block) - 1 for block in sample_blocks)
+    descents = sum(b < a for block in sample_blocks for a, b in zip(block, block[1:]))
+    integer = all(isinstance(value, Integral) for value in sample)
+    return SortProfile(
+        size=size,
+        integer=integer,
+        key_range=max(sample) - min(sample) + 1 if integer else None,
+        descent_ratio=descents / pairs if pairs else 0.0,
+        duplicate_ratio=1 - len(set(sample)) / len(sample),
+    )
+
+
+def _like(values, result):
+    # Every engine answers in the input's own kind: list, array or ndarray.
+    if isinstance(values, array):
+        return result if isinstance(result, array) else array(values.typecode, result)
+    if np is not None and isinstance(values, np.ndarray):
+        return np.asarray(result, dtype=values.dtype)
+    if isinstance(result, list):
+        return result
+    return result.tolist() if hasattr(result, "tolist") else list(result)
+
+
+def _all_integers(values):
+    # The profile only saw a sample; engines that need integer keys check
+    # the whole input before trusting it.
+    if isinstance(values, array):
+        return values.typecode in "bBhHiIlLqQ"
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None:
+        return dtype.kind in "iu"
+    return all(isinstance(value, Integral) for value in values)
+
+
+def _int64_keys(values):
+    # parallel_sort packs lists into int64; typed buffers keep their own type.
+    if not _all_integers(values):
+        return False
+    if isinstance(values, array) or hasattr(values, "dtype"):
+        return True
+    return not values or (-1 << 63 <= min(values) and max(values) < 1 << 63)
+
+
+def _timsort(values):
+    return _like(values, sorted(values))
+
+
+def _introsort(values):
+    result = array(values.typecode, values) if isinstance(values, array) else list(values)
+    introsort(result)
+    return _like(values, result)
+
+
+def _distinct(values):
+    # Counting over a dict: O(n + u log u) for u distinct keys of any type.
+    counts = Counter(values)
+    result = []
+    for value in sorted(counts):
+        result.extend([value] * counts[value])
+    return _like(values, result)
+
+
+def _counting(values):
+    if not _all_integers(values):
+        return _timsort(values)
+    return _like(values, integer_sort(values))
+
+
+def _parallel(values):
+    if not _int64_keys(values):
+        return _timsort(values)
+    return _like(values, parallel_sort(values))
+
+
+ENGINES = {
+    "counting": _counting,
+    "timsort": _timsort,
+    "introsort": _introsort,
+    "distinct": _distinct,
+    "parallel": _parallel,
+}
+
+# (predicate, engine) pairs tried in order; the first match wins.
+RULES = [
+    (lambda p: p.size < 2, "timsort"),
+    (lambda p: p.integer and p.key_range <= COUNTING_RANGE_FACTOR * p.size, "counting"),
+    (lambda p: p.descent_ratio < 0.1 or p.descent_ratio > 0.9, "timsort"),
+    (lambda p: p.integer and p.size >= 16 * PARALLEL_THRESHOLD and cpu_count() > 1, "parallel"),
+    (lambda p: p.duplicate_ratio > 0.9, "distinct"),
+]
+# introsort is pure Python and loses to the builtin Timsort on every input
+# profile under CPython, so it is only used when asked for by name.
+DEFAULT_ENGINE = "timsort"
+
+
+def register_engine(name, func, when=None):
+    """Add a sort engine; if when(profile) is true it is chosen first."""
+    ENGINES[name] = func
+    if when is not None:
+        RULES.insert(0, (when, name))
+
+
+def choose_engine(sort_profile):
+    for predicate, name in RULES:
+        if predicate(sort_profile):
+            return name
+    return DEFAULT_ENGINE
+
+
+def smart_sort(values, engine=None):
+    """Return a sorted copy of values using the engine that suits them."""
+    sort_profile = profile(values)
+    if engine is None:
+        engine = choose_engine(sort_profile)
+    logger.info("sorting with %s: %s", engine, sort_profile)
+    return ENGINES[engine](values)
+
+
+def _inputs(n):
+    uniform = [random.randrange(1 << 30) for _ in range(n)]
+    return {
+        "sorted": sorted(uniform),
+        "reversed": sorted(uniform, reverse=True),
+        "few-unique": [random.randrange(8) * (1 << 20) for _ in range(n)],
+        "zipf": [int(random.paretovariate(1.1)) * 7919 for _ in range(n)],
+        "random": uniform,
+    }
+
+
+def benchmark(n):
+    names = list(ENGINES) + ["smart_sort"]
+    print("%-12s" % "" + "".join("%12s" % name for name in names))
+    for label, values in _inputs(n).items():
+        row = []
+        for name in names:
+            func = smart_sort if name == "smart_sort" else ENGINES[name]
+            start = time.perf_counter()
+            func(values)
+            row.append("%11.3fs" % (time.perf_counter() - start))
+        print("%-12s" % label + "".join(row), "->", choose_engine(profile(values)))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
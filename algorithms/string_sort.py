@@ -0,0 +1,170 @@
+"""MSD radix sort for lists of str or bytes, and for token spans of a buffer.
+
+Strings are split into buckets by the character at the current depth.
+When a whole group shares the next character, the rest of its common
+prefix is skipped in one step. Groups of at most SMALL_GROUP strings
+are finished with a plain sort.
+
+Measured under CPython, this never beats sorted(). Every character
+visit is a Python-level step, while sorted() compares strings with
+memcmp in C. On the bundled corpora msd_radix_sort was 2-3x slower
+than sorted() (moby_dick: 0.203s vs 0.075s). The mmap span path was
+5-9x slower (0.681s). Synthetic input was no better:
+- 100k strings with a 2000-character shared prefix: 0.41s vs 0.30s.
+- 500k strings with three distinct values: 0.25s vs 0.06s.
+
+The span path does not save memory either. Its (start, end) tuples
+took 26.7MB on moby_dick, against 9.8MB for the tokens as bytes. It is
+only useful to callers that want offsets into the file rather than
+copies. Use sorted() otherwise.
+
+Run from the repository root to benchmark on the bundled texts:
+
+    python -m algorithms.string_sort
+"""
+import mmap
+import os
+import re
+import time
+
+SMALL_GROUP = 32
+
+_CORPORA = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                        "python", "basic", "files")
+
+
+def _msd(items, length, char_at, small_sort, shared_prefix=None):
+    # Explicit stack of (group, depth) instead of recursion: a shared
+    # prefix thousands of characters long must not hit the recursion limit.
+    # Groups are pushed in reverse so they are popped in sorted order.
+    result = []
+    stack = [(items, 0)]
+    while stack:
+        group, depth = stack.pop()
+        while True:
+            if len(group) <= SMALL_GROUP:
+                small_sort(group, depth)
+                result.extend(group)
+                break
+            ended = []
+            buckets = {}
+            for item in group:
+                if length(item) == depth:
+                    ended.append(item)
+                else:
+                    char = char_at(item, depth)
+                    bucket = buckets.get(char)
+                    if bucket is None:
+                        buckets[char] = [item]
+                    else:
+                        bucket.append(item)
+            result.extend(ended)
+            depth += 1
+            if len(buckets) == 1:
+                # Every remaining item shares this character: skip the rest
+                # of their common prefix without another trip through the stack.
+                group = next(iter(buckets.values()))
+                if shared_prefix is not None:
+                    depth = shared_prefix(group, depth)
+                continue
+            for char in sorted(buckets, reverse=True):
+                stack.append((buckets[char], depth))
+            break
+    return result
+
+
+def _sort_group(group, depth):
+    # Every string in a group shares its first depth characters, so whole
+    # strings compare exactly like their suffixes, without slicing any.
+    group.sort()
+
+
+def _shared_prefix(group, depth):
+    # The lowest and highest strings share the longest prefix of the group.
+    low, high = min(group), max(group)
+    end = min(len(low), len(high))
+    while depth < end and low[depth] == high[depth]:
+        depth += 1
+    return depth
+
+
+def msd_radix_sort(strings):
+    """Return a sorted list of the given str or bytes objects."""
+    return _msd(list(strings), len, lambda item, depth: item[depth], _sort_group, _shared_prefix)
+
+
+def token_spans(buffer, pattern=rb"[A-Za-z']+"):
+    """Return (start, end) offsets of every token in a bytes-like buffer.
+
+    re scans the buffer in place, and only the offsets are kept, so no
+    bytes object is created per token.
+    """
+    return [match.span() for match in re.finditer(pattern, buffer)]
+
+
+def sort_spans(buffer, spans):
+    """Sort (start, end) spans by the bytes they cover in buffer.
+
+    Characters are read one at a time as ints by indexing the buffer,
+    which works on an mmap without copying any token out of it. It is
+    neither faster nor smaller than sorting the tokens: see the module
+    docstring.
+    """
+    def length(span):
+        return span[1] - span[0]
+
+    def char_at(span, depth):
+        return buffer[span[0] + depth]
+
+    def span_less(a, b, depth):
+        a_start, a_end = a
+        b_start, b_end = b
+        i, j = a_start + depth, b_start + depth
+        while i < a_end and j < b_end:
+            if buffer[i] != buffer[j]:
+                return buffer[i] < buffer[j]
+            i += 1
+            j += 1
+        return i == a_end and j < b_end
+
+    def insertion_sort(group, depth):
+        for i in range(1, len(group)):
+            span = group[i]
+            j = i - 1
+            while j >= 0 and span_less(span, group[j], depth):
+                group[j + 1] = group[j]
+                j -= 1
+            group[j + 1] = span
+
+    return _msd(list(spans), length, char_at, insertion_sort)
+
+
+def sort_file_tokens(path, pattern=rb"[A-Za-z']+"):
+    """Return the tokens of a file as sorted spans, reading it through mmap."""
+    with open(path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return sort_spans(buffer, token_spans(buffer, pattern))
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def benchmark():
+    for name in ("alice.txt", "siddhartha.txt", "little_woman.txt", "moby_dick.txt"):
+        path = os.path.join(_CORPORA, name)
+        with open(path, "rb") as source:
+            data = source.read()
+        words = re.findall(rb"[A-Za-z']+", data)
+        texts = [word.decode() for word in words]
+        print("%-18s %7d tokens  sorted(str) %.3fs  msd(str) %.3fs  "
+              "sorted(bytes) %.3fs  msd(bytes) %.3fs  mmap spans %.3fs"
+              % (name, len(words), _time(sorted, texts), _time(msd_radix_sort, texts),
+                 _time(sorted, words), _time(msd_radix_sort, words),
+                 _time(sort_file_tokens, path)))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,16 @@
+"""Shared inputs for the sort and selection tests."""
+import random
+
+
+def integer_inputs():
+    """Empty, tiny, sorted, reversed, few-unique and wide-range integer lists."""
+    rng = random.Random(4)
+    yield []
+    yield [7]
+    for size in (2, 15, 16, 17, 200, 2000):
+        uniform = [rng.randrange(-1000, 1000) for _ in range(size)]
+        yield uniform
+        yield sorted(uniform)
+        yield sorted(uniform, reverse=True)
+        yield [rng.randrange(3) for _ in range(size)]
+        yield [rng.randrange(1 << 40) for _ in range(size)]
@@ -0,0 +1,54 @@
+from bisect import bisect_left, bisect_right
+import random
+import unittest
+from unittest import mock
+
+from algorithms import batch_search
+from algorithms.batch_search import binary_search_batch, search_sorted
+
+
+def fallback():
+    return mock.patch.object(batch_search, "np", None)
+
+
+class BatchSearchTestCase(unittest.TestCase):
+    """Tests for 'batch_search.py'."""
+
+    def cases(self):
+        rng = random.Random(1)
+        yield [], [0, 1, 2]
+        yield [], []
+        yield [5], [4, 5, 6]
+        yield [1, 1, 1, 2, 2, 9], [0, 1, 2, 3, 9, 10]
+        for size in (10, 100):
+            values = sorted(rng.randrange(size // 2) for _ in range(size))
+            yield values, [rng.randrange(-2, size // 2 + 2) for _ in range(50)]
+
+    def test_search_sorted(self):
+        """Do the numpy path and the bisect fallback give bisect's positions?"""
+        for values, targets in self.cases():
+            for side, bisect in (("left", bisect_left), ("right", bisect_right)):
+                expected = [bisect(values, target) for target in targets]
+                self.assertEqual(list(search_sorted(values, targets, side)), expected)
+                with fallback():
+                    self.assertEqual(list(search_sorted(values, targets, side)), expected)
+
+    def test_binary_search_batch(self):
+        """Is every target found at its leftmost duplicate, or -1, on both paths?"""
+        for values, targets in self.cases():
+            expected = []
+            for target in targets:
+                i = bisect_left(values, target)
+                expected.append(i if i < len(values) and values[i] == target else -1)
+            self.assertEqual(list(binary_search_batch(values, targets)), expected)
+            with fallback():
+                self.assertEqual(list(binary_search_batch(values, targets)), expected)
+
+    def test_bad_side(self):
+        """Is a side other than 'left' or 'right' rejected?"""
+        with self.assertRaises(ValueError):
+            search_sorted([1, 2], [1], side="middle")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from unittest import mock
+
+from algorithms import bitset_bfs
+from algorithms.bitset_bfs import BitsetGraph
+from algorithms.breadth_first import bfs
+
+
+class BitsetGraphTestCase(unittest.TestCase):
+    """Tests for 'bitset_bfs.py'."""
+
+    def setUp(self):
+        rng = random.Random(2)
+        self.graph = {node: rng.sample(range(60), rng.randrange(4)) for node in range(60)}
+        self.bitset = BitsetGraph.from_graph(self.graph)
+
+    def check_all_pairs(self, hops):
+        for start in self.graph:
+            distances = bfs(self.graph, start).distances
+            row = hops[self.bitset.ids[start]]
+            for node in self.graph:
+                self.assertEqual(row[self.bitset.ids[node]], distances.get(node, -1))
+
+    def test_bfs(self):
+        """Do hop counts, with and without max_hops, equal bfs?"""
+        for start in self.graph:
+            for max_hops in (None, 0, 2):
+                self.assertEqual(self.bitset.bfs(start, max_hops),
+                                 bfs(self.graph, start, max_hops=max_hops).distances)
+
+    def test_all_pairs_hops(self):
+        """Is every row of the all-pairs matrix a single-source bfs?"""
+        self.check_all_pairs(self.bitset.all_pairs_hops())
+
+    def test_without_numpy(self):
+        """Do bfs and the list-of-lists all-pairs fallback work without numpy?"""
+        with mock.patch.object(bitset_bfs, "np", None):
+            for start in self.graph:
+                self.assertEqual(self.bitset.bfs(start), bfs(self.graph, start).distances)
+            hops = self.bitset.all_pairs_hops()
+            self.assertIsInstance(hops, list)
+            self.check_all_pairs(hops)
+
+
+if __name__ == '__main__':
+    unittest.main()
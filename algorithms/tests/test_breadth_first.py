@@ -0,0 +1,83 @@
+import unittest
+
+from algorithms.breadth_first import bfs, first_match, within_hops
+from algorithms.csr_graph import CSRGraph
+
+GRAPH = {
+    'you': ['alice', 'bob', 'claire'],
+    'alice': ['peggy'],
+    'bob': ['anuj', 'peggy'],
+    'claire': ['thom', 'jonny'],
+    'anuj': [],
+    'peggy': [],
+    'thom': [],
+    'jonny': [],
+}
+
+
+def five_letters(name):
+    return len(name) == 5
+
+
+class BreadthFirstTestCase(unittest.TestCase):
+    """Tests for 'breadth_first.py'."""
+
+    def graphs(self):
+        yield GRAPH
+        yield {node: dict.fromkeys(neighbors, 1) for node, neighbors in GRAPH.items()}
+        yield CSRGraph.from_adjacency(GRAPH)
+
+    def test_distances_and_parents(self):
+        """Are hop counts and parents the hand-worked ones?"""
+        for graph in self.graphs():
+            result = bfs(graph, 'you')
+            self.assertEqual(result.distances, {
+                'you': 0, 'alice': 1, 'bob': 1, 'claire': 1,
+                'peggy': 2, 'anuj': 2, 'thom': 2, 'jonny': 2})
+            # peggy is reached through alice, the first of her parents expanded.
+            self.assertEqual(result.parents['peggy'], 'alice')
+            self.assertEqual(result.parents['jonny'], 'claire')
+            self.assertIsNone(result.parents['you'])
+            self.assertEqual(result.matches, [])
+
+    def test_max_hops(self):
+        """Does max_hops stop the search after that many levels?"""
+        for graph in self.graphs():
+            self.assertEqual(bfs(graph, 'you', max_hops=0).distances, {'you': 0})
+            self.assertEqual(set(bfs(graph, 'you', max_hops=1).distances),
+                             {'you', 'alice', 'bob', 'claire'})
+            self.assertEqual(within_hops(graph, 'you', five_letters, 1), ['alice'])
+            self.assertEqual(within_hops(graph, 'you', five_letters, 2),
+                             ['alice', 'peggy', 'jonny'])
+
+    def test_find_all(self):
+        """Does find_all collect every match in BFS order, and stop otherwise?"""
+        for graph in self.graphs():
+            self.assertEqual(bfs(graph, 'you', five_letters, find_all=True).matches,
+                             ['alice', 'peggy', 'jonny'])
+            result = bfs(graph, 'you', lambda name: name == 'bob')
+            self.assertEqual(result.matches, ['bob'])
+            # The search stopped before claire's turn came.
+            self.assertNotIn('claire', result.distances)
+
+    def test_first_match(self):
+        """Is the nearest match returned with its path, or (None, None)?"""
+        for graph in self.graphs():
+            self.assertEqual(first_match(graph, 'you', lambda name: name.endswith('m')),
+                             ('thom', ['you', 'claire', 'thom']))
+            self.assertEqual(first_match(graph, 'you', lambda name: name == 'thom', 1),
+                             (None, None))
+            self.assertEqual(first_match(graph, 'you', lambda name: name == 'you'),
+                             ('you', ['you']))
+            self.assertEqual(first_match(graph, 'peggy', lambda name: name == 'you'),
+                             (None, None))
+
+    def test_cycle(self):
+        """Is every node of a cycle visited once?"""
+        graph = {'a': ['b'], 'b': ['a', 'c'], 'c': ['a']}
+        for source in (graph, CSRGraph.from_adjacency(graph)):
+            self.assertEqual(bfs(source, 'a').distances, {'a': 0, 'b': 1, 'c': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
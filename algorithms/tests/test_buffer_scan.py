@@ -0,0 +1,67 @@
+from array import array
+import random
+import unittest
+from unittest import mock
+
+from algorithms import buffer_scan
+from algorithms.buffer_scan import _scan_chunked, as_view, scan
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def naive(values, targets, find_all):
+    if find_all:
+        return {t: [i for i, value in enumerate(values) if value == t] for t in targets}
+    return {t: values.index(t) if t in values else -1 for t in targets}
+
+
+class BufferScanTestCase(unittest.TestCase):
+    """Tests for 'buffer_scan.py'."""
+
+    def check(self, buffer, targets, format=None, chunk_size=4):
+        values = as_view(buffer, format).tolist()
+        for find_all in (False, True):
+            expected = naive(values, set(targets), find_all)
+            self.assertEqual(_scan_chunked(as_view(buffer, format), set(targets), find_all,
+                                           chunk_size), expected)
+            self.assertEqual(scan(buffer, targets, find_all, format, chunk_size), expected)
+
+    def test_matches_naive(self):
+        """Do the numpy scan and the chunked fallback agree with a plain loop?"""
+        rng = random.Random(1)
+        for size in (0, 1, 5, 64):
+            values = array('i', (rng.randrange(20) for _ in range(size)))
+            # A few targets take the list.index loop, many the set loop.
+            for count in (1, 3, 12):
+                self.check(values, rng.sample(range(-2, 22), count))
+
+    def test_chunk_boundary(self):
+        """Are runs of a target split across two chunks reported in full?"""
+        values = array('i', [0, 0, 0, 7, 7, 0, 0, 9, 9, 9, 0])
+        for chunk_size in (1, 2, 3, 4, 8):
+            self.check(values, [7, 9], chunk_size=chunk_size)
+            self.check(values, list(range(1, 11)), chunk_size=chunk_size)
+
+    def test_reinterpreted_bytes(self):
+        """Does a format count positions in items across chunk edges, not bytes?"""
+        data = array('i', [5, 6, 7, 8, 6, 5]).tobytes()
+        self.check(data, [6, 8], format='i', chunk_size=3)
+        self.check(bytearray(data), [5], format='i', chunk_size=2)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_input(self):
+        """Is a 2-D numpy array scanned flat?"""
+        values = np.arange(12, dtype=np.int64).reshape(3, 4)
+        self.check(values, [3, 4, 11, 20])
+
+    def test_without_numpy(self):
+        """Does scan fall back to the chunked loop when numpy is missing?"""
+        with mock.patch.object(buffer_scan, "np", None):
+            self.check(array('i', [1, 2, 3, 2, 1]), [2, 3, 4], chunk_size=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from algorithms.contraction_hierarchies import ContractionHierarchy
+from algorithms.point_to_point import road_graph
+from algorithms.random_graphs import random_weighted
+from algorithms.shortest_paths import infinity, shortest_paths
+
+
+class ContractionHierarchyTestCase(unittest.TestCase):
+    """Tests for 'contraction_hierarchies.py'."""
+
+    def check(self, graph, hierarchy):
+        for source in graph:
+            costs, _ = shortest_paths(graph, source)
+            for target in graph:
+                route = hierarchy.query(source, target)
+                expected = costs.get(target, infinity)
+                if expected == infinity:
+                    self.assertEqual(route.cost, infinity)
+                    continue
+                # Road weights are floats, summed in a different order.
+                self.assertAlmostEqual(route.cost, expected)
+                self.assertEqual(route.path[0], source)
+                self.assertEqual(route.path[-1], target)
+                self.assertAlmostEqual(
+                    sum(graph[a][b] for a, b in zip(route.path, route.path[1:])), route.cost)
+
+    def test_random_graphs(self):
+        """Do queries give Dijkstra's costs and real unpacked paths?"""
+        for seed in range(15):
+            graph = random_weighted(18, 45, seed, loops=False)
+            for witness_limit in (1, 64):
+                self.check(graph, ContractionHierarchy.build(graph, witness_limit))
+
+    def round_trip(self, hierarchy):
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "index.ch")
+            hierarchy.save(path)
+            return ContractionHierarchy.load(path)
+
+    def test_road_graph_save_load(self):
+        """Does a saved hierarchy answer the same after loading?"""
+        graph, _ = road_graph(5, 5, seed=2)
+        hierarchy = ContractionHierarchy.build(graph)
+        loaded = self.round_trip(hierarchy)
+        self.check(graph, loaded)
+        for name in ("rank", "up", "down", "middle"):
+            self.assertEqual(getattr(loaded, name), getattr(hierarchy, name))
+
+    def test_save_load_names(self):
+        """Do integer and string nodes and their shortcuts survive a round trip?"""
+        graph = random_weighted(18, 45, 3, loops=False)
+        named = {str(node): {str(other): weight for other, weight in neighbors.items()}
+                 for node, neighbors in graph.items()}
+        for source in (graph, named):
+            hierarchy = ContractionHierarchy.build(source, witness_limit=1)
+            self.assertTrue(hierarchy.shortcut_count)
+            loaded = self.round_trip(hierarchy)
+            self.assertEqual(loaded.middle, hierarchy.middle)
+            self.check(source, loaded)
+
+    def test_unsavable_node(self):
+        """Is a node that cannot be written as a literal rejected?"""
+        hierarchy = ContractionHierarchy.build({object(): {}})
+        with tempfile.TemporaryDirectory() as workdir:
+            with self.assertRaises(ValueError):
+                hierarchy.save(os.path.join(workdir, "index.ch"))
+
+    def test_load_rejects_other_files(self):
+        """Are foreign files, other versions and truncated files rejected?"""
+        hierarchy = ContractionHierarchy.build(random_weighted(6, 10, 1))
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "index.ch")
+            hierarchy.save(path)
+            with open(path, "rb") as source:
+                data = source.read()
+            for bad in (b"\x80\x05" + data[2:], data[:4] + b"\x02\x00" + data[6:],
+                        data[:len(data) // 2], b""):
+                with open(path, "wb") as target:
+                    target.write(bad)
+                with self.assertRaises(ValueError):
+                    ContractionHierarchy.load(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from array import array
+import random
+import unittest
+
+from algorithms.cracking_search import CrackingIndex
+
+
+class CrackingIndexTestCase(unittest.TestCase):
+    """Tests for 'cracking_search.py'."""
+
+    def check_invariants(self, index, data):
+        values = index.values
+        # Still a permutation of the input, with rowids pointing back into it.
+        self.assertEqual(sorted(values), sorted(data))
+        self.assertEqual([data[row] for row in index.rowids], list(values))
+        self.assertEqual(index._bounds, sorted(index._bounds))
+        self.assertEqual(index._positions, sorted(index._positions))
+        for (key, inclusive), position in zip(index._bounds, index._positions):
+            if inclusive:
+                self.assertTrue(all(value <= key for value in values[:position]))
+                self.assertTrue(all(value > key for value in values[position:]))
+            else:
+                self.assertTrue(all(value < key for value in values[:position]))
+                self.assertTrue(all(value >= key for value in values[position:]))
+
+    def test_matches_naive_scan(self):
+        """Do search, count and positions match a scan after every crack?"""
+        for seed in range(20):
+            rng = random.Random(seed)
+            data = [rng.randrange(30) for _ in range(rng.choice([0, 1, 10, 80]))]
+            index = CrackingIndex(array('i', data) if seed % 2 else data)
+            for _ in range(40):
+                key = rng.randrange(-2, 33)
+                expected = [i for i, value in enumerate(data) if value == key]
+                query = rng.choice(["search", "count", "positions"])
+                if query == "search":
+                    self.assertEqual(index.search(key), bool(expected))
+                elif query == "count":
+                    self.assertEqual(index.count(key), len(expected))
+                else:
+                    self.assertEqual(index.positions(key), expected)
+                self.check_invariants(index, data)
+
+    def test_input_untouched(self):
+        """Is the caller's array left in its original order?"""
+        data = array('i', [5, 3, 9, 1, 3])
+        index = CrackingIndex(data)
+        index.search(3)
+        self.assertEqual(list(data), [5, 3, 9, 1, 3])
+
+    def test_cost_falls(self):
+        """Does a repeated key touch nothing once its piece is cracked?"""
+        index = CrackingIndex(list(range(100, 0, -1)))
+        index.search(50)
+        index.search(50)
+        stats = index.stats(window=1)
+        self.assertEqual(stats["queries"], 2)
+        self.assertEqual(stats["last_cost"], 0)
+        self.assertEqual(stats["pieces"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
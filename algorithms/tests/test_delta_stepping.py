@@ -0,0 +1,44 @@
+import unittest
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.delta_stepping import delta_stepping, suggest_delta
+from algorithms.random_graphs import random_weighted
+from algorithms.shortest_paths import csr_shortest_paths
+
+
+class DeltaSteppingTestCase(unittest.TestCase):
+    """Tests for 'delta_stepping.py'."""
+
+    def test_matches_dijkstra(self):
+        """Are the costs the same as csr_shortest_paths on random graphs?"""
+        for seed in range(20):
+            graph = CSRGraph.from_weighted(random_weighted(30, 90, seed, weights=(0, 10)))
+            expected, _ = csr_shortest_paths(graph, 0)
+            for delta in (None, 0.5, 3, 100):
+                costs, _ = delta_stepping(graph, 0, delta)
+                self.assertEqual(list(costs), list(expected))
+
+    def test_worker_processes(self):
+        """Do buckets relaxed across worker processes give the same costs?"""
+        graph = CSRGraph.from_weighted(random_weighted(60, 300, 1, weights=(0, 10)))
+        expected, _ = csr_shortest_paths(graph, 0)
+        costs, _ = delta_stepping(graph, 0, 2, processes=2, parallel_edges=1)
+        self.assertEqual(list(costs), list(expected))
+
+    def test_zero_weights(self):
+        """Does a graph whose weights are all 0 terminate?"""
+        graph = CSRGraph.from_weighted({'a': {'b': 0}, 'b': {}})
+        self.assertEqual(suggest_delta(graph), 1.0)
+        costs, _ = delta_stepping(graph, 0)
+        self.assertEqual(list(costs), [0, 0])
+
+    def test_non_positive_delta(self):
+        """Is a delta <= 0 rejected instead of looping forever?"""
+        graph = random_weighted(5, 10, 0)
+        for delta in (0, -1):
+            with self.assertRaises(ValueError):
+                delta_stepping(graph, 0, delta)
+
+
+if __name__ == '__main__':
+    unittest.main()
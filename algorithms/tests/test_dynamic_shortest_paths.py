@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from algorithms.dynamic_shortest_paths import DynamicShortestPaths
+from algorithms.random_graphs import random_weighted
+from algorithms.shortest_paths import shortest_paths
+
+
+class DynamicShortestPathsTestCase(unittest.TestCase):
+    """Tests for 'dynamic_shortest_paths.py'."""
+
+    def random_updates(self, paths, rng, size):
+        updates = []
+        edges = {(node, neighbor) for node, neighbors in paths.graph.items()
+                 for neighbor in neighbors}
+        for _ in range(size):
+            if edges and rng.random() < 0.3:
+                edge = rng.choice(sorted(edges))
+                edges.discard(edge)
+                updates.append(edge + (None,))
+            else:
+                edge = (rng.randrange(22), rng.randrange(22))
+                edges.add(edge)
+                updates.append(edge + (rng.randint(0, 12),))
+        return updates
+
+    def test_matches_recompute(self):
+        """Do repaired costs equal a full Dijkstra after every batch?"""
+        for seed in range(40):
+            rng = random.Random(seed)
+            paths = DynamicShortestPaths(random_weighted(20, 50, rng), 0)
+            for _ in range(15):
+                paths.apply(self.random_updates(paths, rng, rng.randint(1, 4)))
+                costs, _ = shortest_paths(paths.graph, 0)
+                self.assertEqual(paths.costs, costs)
+                self.assertEqual(paths.verify(), [])
+                for node, parent in paths.parents.items():
+                    if parent is not None:
+                        self.assertEqual(paths.costs[node],
+                                         paths.costs[parent] + paths.graph[parent][node])
+
+    def test_sink_only_nodes(self):
+        """Can the graph name nodes only as edge targets?"""
+        paths = DynamicShortestPaths({'s': {'a': 5}}, 's')
+        self.assertEqual(paths.costs, {'s': 0, 'a': 5})
+
+    def test_failed_batch_changes_nothing(self):
+        """Does a bad update leave the earlier ones in its batch unapplied?"""
+        paths = DynamicShortestPaths({'s': {'a': 5}, 'a': {}}, 's', check=True)
+        with self.assertRaises(KeyError):
+            paths.apply([('s', 'a', 1), ('s', 'zz', None)])
+        with self.assertRaises(ValueError):
+            paths.apply([('s', 'a', 1), ('a', 's', -1)])
+        self.assertEqual(paths.graph, {'s': {'a': 5}, 'a': {}})
+        self.assertEqual(paths.costs['a'], 5)
+        self.assertEqual(paths.verify(), [])
+
+    def test_set_then_remove_in_one_batch(self):
+        """Does a batch that adds and removes the same edge repair cleanly?"""
+        paths = DynamicShortestPaths({'s': {'a': 5}, 'a': {}}, 's', check=True)
+        paths.apply([('s', 'b', 1), ('s', 'b', None), ('s', 'a', 2)])
+        self.assertEqual(paths.costs, {'s': 0, 'a': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import random
+import tempfile
+import unittest
+
+from algorithms.external_sort import external_sort
+
+
+class ExternalSortTestCase(unittest.TestCase):
+    """Tests for 'external_sort.py'."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, 'input')
+        self.output = os.path.join(self.directory.name, 'output')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_integers(self):
+        """Do many small runs and merge passes give sorted() order?"""
+        rng = random.Random(6)
+        values = [rng.randrange(-1 << 62, 1 << 62) for _ in range(5000)]
+        with open(self.input, 'w') as target:
+            target.write('\n'.join(map(str, values)) + '\n')
+        external_sort(self.input, self.output, 'int', memory_budget=800, fan_in=3)
+        with open(self.output) as source:
+            self.assertEqual([int(line) for line in source], sorted(values))
+
+    def test_text(self):
+        """Are text lines sorted bytewise across runs?"""
+        rng = random.Random(7)
+        lines = [''.join(rng.choice('abc') for _ in range(rng.randrange(1, 8)))
+                 for _ in range(2000)]
+        with open(self.input, 'w') as target:
+            target.write('\n'.join(lines) + '\n')
+        external_sort(self.input, self.output, 'text', memory_budget=2000, fan_in=4)
+        with open(self.output) as source:
+            self.assertEqual(source.read().splitlines(), sorted(lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+from array import array
+from bisect import bisect_left
+import random
+import unittest
+
+from algorithms.eytzinger_search import EytzingerIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class EytzingerIndexTestCase(unittest.TestCase):
+    """Tests for 'eytzinger_search.py'."""
+
+    def check(self, values):
+        index = EytzingerIndex(values)
+        targets = list(range(-2, 2 * len(values) + 3))
+        expected = []
+        for target in targets:
+            i = bisect_left(list(values), target)
+            expected.append(i if i < len(values) and values[i] == target else -1)
+        self.assertEqual([index.search(target) for target in targets], expected)
+        self.assertEqual(list(index.search_many(targets)), expected)
+
+    def test_list_and_array(self):
+        """Does search agree with bisect on lists and array('i')?"""
+        for size in (0, 1, 2, 7, 8, 50):
+            values = sorted(random.Random(size).sample(range(2 * size + 1), size))
+            self.check(values)
+            self.check(array('i', values))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self):
+        """Does search work on numpy arrays, not only search_many?"""
+        self.check(np.arange(0, 100, 2, dtype=np.int32))
+        self.assertEqual(EytzingerIndex(np.arange(0, 100, 2, dtype=np.int32)).search(4), 2)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_list_layout_is_typed(self):
+        """Is a list's layout mirrored in a typed array, not an object one?"""
+        self.assertNotEqual(EytzingerIndex(list(range(0, 100, 2)))._layout_array.dtype, object)
+        index = EytzingerIndex(['apple', 'banana', 'cherry'])
+        self.assertEqual(list(index.search_many(['banana', 'kiwi', 'apple'])), [1, -1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
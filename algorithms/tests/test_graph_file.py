@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.graph_file import convert_edge_list, load_graph, save_graph
+
+
+class GraphFileTestCase(unittest.TestCase):
+    """Tests for 'graph_file.py'."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.edges = os.path.join(self.directory.name, 'edges.csv')
+        self.output = os.path.join(self.directory.name, 'graph.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def convert(self, text):
+        with open(self.edges, 'w') as target:
+            target.write(text)
+        return convert_edge_list(self.edges, self.output)
+
+    def test_round_trip(self):
+        """Does a saved graph load back with the same edges?"""
+        weighted = {'a': {'b': 1.5, 'c': 2.0}, 'b': {'c': 1.0}, 'c': {}}
+        save_graph(CSRGraph.from_weighted(weighted), self.output)
+        self.assertEqual(load_graph(self.output).to_weighted(), weighted)
+
+    def test_convert_with_header(self):
+        """Is a source,target,weight header row skipped?"""
+        self.assertEqual(self.convert('source,target,weight\na,b,1\nb,c,2.5\n'), (3, 2))
+        graph = load_graph(self.output)
+        self.assertEqual(graph.to_weighted(), {'a': {'b': 1.0}, 'b': {'c': 2.5}, 'c': {}})
+
+    def test_bad_rows(self):
+        """Do bad rows raise ValueError and leave no output file behind?"""
+        for text in ('a,b,1\nb,c,heavy\n', 'a,b\nb\n'):
+            with self.assertRaises(ValueError):
+                self.convert(text)
+            self.assertFalse(os.path.exists(self.output))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+from array import array
+import unittest
+
+from algorithms.integer_sort import counting_sort, integer_sort, radix_sort
+from algorithms.tests.sequences import integer_inputs
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class IntegerSortTestCase(unittest.TestCase):
+    """Tests for 'integer_sort.py'."""
+
+    def test_matches_sorted(self):
+        """Do counting, radix and integer_sort agree with sorted()?"""
+        for values in integer_inputs():
+            self.assertEqual(list(integer_sort(values)), sorted(values))
+            self.assertEqual(list(radix_sort(values)), sorted(values))
+            if values and max(values) - min(values) < 1 << 16:
+                self.assertEqual(list(counting_sort(values)), sorted(values))
+            self.assertEqual(list(integer_sort(array('q', values))), sorted(values))
+
+    def test_key(self):
+        """Are records with equal keys kept in input order?"""
+        for values in integer_inputs():
+            records = [(value % 7, index) for index, value in enumerate(values)]
+            by_key = sorted(records, key=lambda record: record[0])
+            self.assertEqual(integer_sort(records, key=lambda record: record[0]), by_key)
+            self.assertEqual(radix_sort(records, key=lambda record: record[0]), by_key)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_full_width(self):
+        """Are int64 ranges of 2**63 and more, and uint64 keys, sorted?"""
+        for values in ([2 ** 62, -2 ** 62], [2 ** 63 - 1, -2 ** 63, 0, 5, -5]):
+            for sort in (radix_sort, integer_sort):
+                self.assertEqual(sort(np.array(values, dtype=np.int64)).tolist(), sorted(values))
+        unsigned = [2 ** 64 - 1, 0, 2 ** 63, 7]
+        self.assertEqual(radix_sort(np.array(unsigned, dtype=np.uint64)).tolist(), sorted(unsigned))
+        for values in integer_inputs():
+            for bits in (8, 11, 16):
+                self.assertEqual(radix_sort(np.array(values, dtype=np.int64), bits=bits).tolist(),
+                                 sorted(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
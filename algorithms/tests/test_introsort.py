@@ -0,0 +1,19 @@
+import unittest
+
+from algorithms.introsort import introsort
+from algorithms.tests.sequences import integer_inputs
+
+
+class IntrosortTestCase(unittest.TestCase):
+    """Tests for 'introsort.py'."""
+
+    def test_matches_sorted(self):
+        """Does introsort sort in place like sorted()?"""
+        for values in integer_inputs():
+            result = list(values)
+            introsort(result)
+            self.assertEqual(result, sorted(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
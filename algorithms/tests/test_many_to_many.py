@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from algorithms.many_to_many import load_matrix, many_to_many, many_to_many_matrix
+from algorithms.point_to_point import road_graph
+from algorithms.shortest_paths import infinity, shortest_paths
+
+
+class ManyToManyTestCase(unittest.TestCase):
+    """Tests for 'many_to_many.py'."""
+
+    def setUp(self):
+        self.graph, _ = road_graph(6, 6, seed=3)
+        self.nodes = list(self.graph)
+        self.sources = self.nodes[::5]
+
+    def expected(self, source):
+        costs, _ = shortest_paths(self.graph, source)
+        return [costs.get(target, infinity) for target in self.nodes]
+
+    def test_rows(self):
+        """Do in-process and pooled rows match shortest_paths?"""
+        for processes in (1, 2):
+            rows = dict(many_to_many(self.graph, self.sources, self.nodes, processes))
+            self.assertEqual(set(rows), set(self.sources))
+            for source, row in rows.items():
+                self.assertEqual(list(row), self.expected(source))
+
+    def test_interleaved_generators(self):
+        """Do two generators consumed in turn keep their own graphs?"""
+        first = many_to_many({'a': {'b': 1}, 'b': {}}, ['a', 'b'], ['b'], processes=1)
+        second = many_to_many({'a': {'b': 100}, 'b': {}}, ['a', 'b'], ['b'], processes=1)
+        self.assertEqual(next(first)[1][0], 1.0)
+        self.assertEqual(next(second)[1][0], 100.0)
+        self.assertEqual(next(first), ('b', next(second)[1]))
+
+    def test_matrix(self):
+        """Does the matrix file hold the same costs as the rows?"""
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            for processes in (1, 2):
+                many_to_many_matrix(self.graph, self.sources, self.nodes, path, processes)
+                rows = load_matrix(path)
+                self.assertEqual(len(rows), len(self.sources))
+                for source, row in zip(self.sources, rows):
+                    self.assertEqual(list(row), self.expected(source))
+                del rows
+        finally:
+            os.remove(path)
+
+    def test_empty_matrix(self):
+        """Do empty sources or targets give an empty matrix, not an mmap error?"""
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            for processes in (1, 2):
+                many_to_many_matrix(self.graph, [], self.nodes, path, processes)
+                self.assertEqual(load_matrix(path), [])
+                many_to_many_matrix(self.graph, self.sources, [], path, processes)
+                self.assertEqual([list(row) for row in load_matrix(path)],
+                                 [[] for _ in self.sources])
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from algorithms.breadth_first import bfs
+from algorithms.csr_graph import CSRGraph
+from algorithms.parallel_bfs import parallel_bfs, reverse_csr
+from algorithms.random_graphs import random_adjacency
+
+
+class ParallelBFSTestCase(unittest.TestCase):
+    """Tests for 'parallel_bfs.py'."""
+
+    def test_matches_bfs(self):
+        """Do hop counts equal bfs and every parent sit one level up?"""
+        for seed in range(20):
+            # Sparse and dense graphs exercise both the top-down and the
+            # bottom-up steps.
+            graph = CSRGraph.from_adjacency(random_adjacency(40 + seed, (1 + seed % 4) * 60, seed))
+            reverse = reverse_csr(graph)
+            for processes in (1, 3):
+                for source in (0, graph.node_count // 2):
+                    distances, parents = parallel_bfs(graph, source, processes, reverse)
+                    expected = bfs(graph, source).distances
+                    for node in range(graph.node_count):
+                        self.assertEqual(distances[node], expected.get(node, -1))
+                        if node == source or distances[node] < 0:
+                            self.assertEqual(parents[node], -1)
+                        else:
+                            parent = parents[node]
+                            self.assertEqual(distances[parent], distances[node] - 1)
+                            self.assertIn(node, graph.neighbors(parent))
+
+    def test_reverse_csr(self):
+        """Does reverse_csr list exactly the incoming edges of every node?"""
+        graph = CSRGraph.from_adjacency(random_adjacency(30, 90, 1))
+        offsets, sources = reverse_csr(graph)
+        incoming = {node: sorted(sources[offsets[node]:offsets[node + 1]])
+                    for node in range(graph.node_count)}
+        expected = {node: [] for node in range(graph.node_count)}
+        for node in range(graph.node_count):
+            for neighbor in graph.neighbors(node):
+                expected[neighbor].append(node)
+        self.assertEqual(incoming, {node: sorted(found) for node, found in expected.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+from array import array
+import unittest
+
+from algorithms.parallel_sort import parallel_sort
+from algorithms.tests.sequences import integer_inputs
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ParallelSortTestCase(unittest.TestCase):
+    """Tests for 'parallel_sort.py'."""
+
+    def test_matches_sorted(self):
+        """Do the bucketed worker ranges join into one sorted array?"""
+        for values in integer_inputs():
+            for workers in (1, 2, 3):
+                result = parallel_sort(array('q', values), workers, threshold=0)
+                self.assertEqual(list(result), sorted(values))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_input(self):
+        """Are ndarrays of several dtypes, strided ones included, sorted as ndarrays?"""
+        rng = np.random.default_rng(8)
+        for dtype in (np.int64, np.int32, np.uint16, np.float64):
+            values = (rng.random(5000) * 60000).astype(dtype)
+            for data in (values, values[::-3]):
+                result = parallel_sort(data, 3, threshold=0)
+                self.assertEqual(result.dtype, data.dtype)
+                self.assertEqual(result.tolist(), sorted(data.tolist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from algorithms.point_to_point import (
+    astar, bidirectional_dijkstra, euclidean_heuristic, grid_graph, reverse_graph)
+from algorithms.random_graphs import random_weighted
+from algorithms.shortest_paths import infinity, shortest_paths
+
+
+def path_cost(graph, path):
+    return sum(graph[a][b] for a, b in zip(path, path[1:]))
+
+
+class PointToPointTestCase(unittest.TestCase):
+    """Tests for 'point_to_point.py'."""
+
+    def test_matches_dijkstra(self):
+        """Do bidirectional Dijkstra and A* give the plain Dijkstra costs?"""
+        for seed in range(30):
+            graph = random_weighted(25, 60, seed)
+            reverse = reverse_graph(graph)
+            for source in range(0, 25, 6):
+                costs, _ = shortest_paths(graph, source)
+                for target in range(25):
+                    expected = costs.get(target, infinity)
+                    for route in (bidirectional_dijkstra(graph, source, target, reverse),
+                                  astar(graph, source, target)):
+                        self.assertEqual(route.cost, expected)
+                        if route.path is not None:
+                            self.assertEqual(path_cost(graph, route.path), expected)
+
+    def test_inconsistent_heuristic(self):
+        """Does an admissible but inconsistent heuristic still give exact costs?"""
+        for seed in range(30):
+            rng = random.Random(seed)
+            graph = random_weighted(25, 80, seed)
+            target = 24
+            remaining, _ = shortest_paths(reverse_graph(graph), target)
+            guesses = {node: rng.random() * remaining.get(node, 0) for node in graph}
+            costs, _ = shortest_paths(graph, 0)
+            route = astar(graph, 0, target, guesses.get)
+            self.assertEqual(route.cost, costs.get(target, infinity))
+
+    def test_euclidean_heuristic(self):
+        """Does A* on a grid with straight-line distances find the optimum?"""
+        graph, coordinates = grid_graph(8, 8, seed=2)
+        nodes = list(graph)
+        costs, _ = shortest_paths(graph, nodes[0])
+        for target in nodes:
+            route = astar(graph, nodes[0], target, euclidean_heuristic(coordinates, target))
+            self.assertEqual(route.cost, costs[target])
+
+
+if __name__ == '__main__':
+    unittest.main()
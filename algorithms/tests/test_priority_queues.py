@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from algorithms.priority_queues import IndexedBinaryHeap, PairingHeap, dijkstra
+from algorithms.random_graphs import random_csr
+from algorithms.shortest_paths import csr_shortest_paths
+
+QUEUES = (IndexedBinaryHeap, PairingHeap)
+
+
+class PriorityQueuesTestCase(unittest.TestCase):
+    """Tests for 'priority_queues.py'."""
+
+    def test_matches_reference(self):
+        """Do random push/decrease_key/pop sequences match a dict reference?"""
+        for queue_type in QUEUES:
+            for seed in range(30):
+                rng = random.Random(seed)
+                queue = queue_type(40)
+                reference = {}
+                for _ in range(300):
+                    action = rng.random()
+                    if action < 0.4:
+                        node = rng.randrange(40)
+                        if node not in reference:
+                            reference[node] = rng.randint(0, 1000)
+                            queue.push(node, reference[node])
+                    elif action < 0.7 and reference:
+                        node = rng.choice(sorted(reference))
+                        reference[node] -= rng.randint(0, 200)
+                        queue.decrease_key(node, reference[node])
+                    elif reference:
+                        node, key = queue.pop()
+                        self.assertEqual(key, min(reference.values()))
+                        self.assertEqual(reference.pop(node), key)
+                    self.assertEqual(len(queue), len(reference))
+                    for node in range(40):
+                        self.assertEqual(node in queue, node in reference)
+                drained = [queue.pop()[1] for _ in range(len(queue))]
+                self.assertEqual(drained, sorted(reference.values()))
+
+    def test_misuse(self):
+        """Are double pushes and updates of absent nodes rejected untouched?"""
+        for queue_type in QUEUES:
+            queue = queue_type(5)
+            queue.push(0, 5.0)
+            queue.push(1, 7.0)
+            with self.assertRaises(ValueError):
+                queue.push(0, 1.0)
+            with self.assertRaises(KeyError):
+                queue.decrease_key(3, 1.0)
+            with self.assertRaises(ValueError):
+                queue.decrease_key(1, 9.0)
+            self.assertEqual(len(queue), 2)
+            self.assertEqual([queue.pop(), queue.pop()], [(0, 5.0), (1, 7.0)])
+            with self.assertRaises(IndexError):
+                queue.pop()
+
+    def test_dijkstra(self):
+        """Does Dijkstra on either queue give csr_shortest_paths' costs?"""
+        for seed in range(10):
+            graph = random_csr(50, 200, seed)
+            expected, _ = csr_shortest_paths(graph, 0)
+            for queue_type in QUEUES:
+                self.assertEqual(dijkstra(graph, 0, queue_type)[0], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from algorithms.breadth_first import bfs
+from algorithms.csr_graph import CSRGraph
+from algorithms.random_graphs import random_adjacency
+from algorithms.reachability import ReachabilityIndex
+
+
+class ReachabilityIndexTestCase(unittest.TestCase):
+    """Tests for 'reachability.py'."""
+
+    def check(self, index, graph):
+        for source in graph:
+            reached = bfs(graph, source).distances
+            for target in graph:
+                self.assertEqual(index.reaches(source, target), target in reached)
+
+    def test_matches_bfs(self):
+        """Does every pair agree with bfs, with one or several traversals?"""
+        for seed in range(40):
+            rng = random.Random(seed)
+            nodes = rng.choice([1, 5, 20, 40])
+            graph = random_adjacency(nodes, rng.choice([nodes, 2 * nodes, 4 * nodes]), rng)
+            self.check(ReachabilityIndex(graph, traversals=rng.choice([1, 3]), seed=seed), graph)
+
+    def test_add_edge(self):
+        """Do answers stay exact while edges, cycles and new nodes are added?"""
+        for seed in range(40):
+            rng = random.Random(seed)
+            graph = random_adjacency(15, 15, rng)
+            index = ReachabilityIndex(graph, seed=seed)
+            for _ in range(10):
+                # Ids up to 17 also add nodes the index has not seen.
+                source, target = rng.randrange(18), rng.randrange(18)
+                graph.setdefault(source, []).append(target)
+                graph.setdefault(target, [])
+                index.add_edge(source, target)
+                self.check(index, graph)
+
+    def test_inputs(self):
+        """Are dict-of-dicts and CSRGraph inputs indexed the same way?"""
+        graph = {'a': {'b': 1}, 'b': {'c': 2}, 'c': {'a': 1}, 'd': {'a': 5}}
+        for source in (graph, CSRGraph.from_weighted(graph)):
+            index = ReachabilityIndex(source)
+            self.assertTrue(index.reaches('d', 'c'))
+            self.assertFalse(index.reaches('c', 'd'))
+            self.assertEqual(index.stats()['components'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from bisect import bisect_left
+import random
+import unittest
+import warnings
+
+from algorithms.search_strategies import STRATEGIES, choose_strategy, search
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def expected_index(values, target):
+    i = bisect_left(values, target)
+    return i if i < len(values) and values[i] == target else -1
+
+
+class SearchStrategiesTestCase(unittest.TestCase):
+    """Tests for 'search_strategies.py'."""
+
+    def test_strategies_match_bisect(self):
+        """Does every strategy find the first occurrence like bisect?"""
+        rng = random.Random(3)
+        for size in (0, 1, 2, 10, 300):
+            for values in (sorted(rng.randrange(size * 2 + 1) for _ in range(size)),
+                           [i * i for i in range(size)]):
+                for target in range(-1, 2 * size + 2):
+                    for name, strategy in STRATEGIES.items():
+                        self.assertEqual(strategy(values, target), expected_index(values, target),
+                                         (name, size, target))
+                    self.assertEqual(search(values, target), expected_index(values, target))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_int32_overflow(self):
+        """Are wide int32 keys handled without fixed-width overflow?"""
+        values = np.arange(0, 2000000000, 1000, dtype=np.int32)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(choose_strategy(values), "interpolation")
+            for target in (0, 1000, 1999999000, 1999999001, 1234567000):
+                self.assertEqual(STRATEGIES["interpolation"](values, target),
+                                 expected_index(values.tolist(), target))
+
+
+if __name__ == '__main__':
+    unittest.main()
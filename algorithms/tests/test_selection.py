@@ -0,0 +1,25 @@
+import statistics
+import unittest
+
+from algorithms.selection import median, select, smallest_k, stream_smallest_k
+from algorithms.tests.sequences import integer_inputs
+
+
+class SelectionTestCase(unittest.TestCase):
+    """Tests for 'selection.py'."""
+
+    def test_matches_sorting(self):
+        """Do the selection helpers agree with sorting?"""
+        for values in integer_inputs():
+            if not values:
+                continue
+            ordered = sorted(values)
+            for k in (0, 1, len(values) // 2, len(values)):
+                self.assertEqual(sorted(smallest_k(values, k)), ordered[:k])
+                self.assertEqual(sorted(stream_smallest_k(iter(values), k)), ordered[:k])
+            self.assertEqual(select(values, len(values) // 2), ordered[len(values) // 2])
+            self.assertEqual(median(values), statistics.median(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
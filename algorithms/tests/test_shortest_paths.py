@@ -0,0 +1,41 @@
+import unittest
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.random_graphs import random_weighted
+from algorithms.shortest_paths import csr_shortest_paths, infinity, shortest_paths
+
+
+def bellman_ford(graph, source):
+    costs = {source: 0}
+    for _ in range(len(graph)):
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                if node in costs and costs[node] + weight < costs.get(neighbor, infinity):
+                    costs[neighbor] = costs[node] + weight
+    return costs
+
+
+class ShortestPathsTestCase(unittest.TestCase):
+    """Tests for 'shortest_paths.py'."""
+
+    def test_matches_bellman_ford(self):
+        """Do the dict and CSR paths give Bellman-Ford's costs?"""
+        for seed in range(30):
+            graph = random_weighted(15, 40, seed, weights=(0, 9))
+            expected = bellman_ford(graph, 0)
+            self.assertEqual(shortest_paths(graph, 0)[0], expected)
+            self.assertEqual(shortest_paths(CSRGraph.from_weighted(graph), 0)[0], expected)
+
+    def test_negative_weight(self):
+        """Is a negative weight rejected whatever the graph type?"""
+        graph = {'a': {'b': -1}, 'b': {}}
+        with self.assertRaises(ValueError):
+            shortest_paths(graph, 'a')
+        with self.assertRaises(ValueError):
+            shortest_paths(CSRGraph.from_weighted(graph), 'a')
+        with self.assertRaises(ValueError):
+            csr_shortest_paths(CSRGraph.from_weighted(graph), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
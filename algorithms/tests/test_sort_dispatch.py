@@ -0,0 +1,48 @@
+from array import array
+import unittest
+
+from algorithms.sort_dispatch import ENGINES, smart_sort
+from algorithms.tests.sequences import integer_inputs
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SortDispatchTestCase(unittest.TestCase):
+    """Tests for 'sort_dispatch.py'."""
+
+    def test_smart_sort(self):
+        """Does every engine, and the dispatcher, return sorted copies?"""
+        for values in integer_inputs():
+            for engine in [None] + list(ENGINES):
+                self.assertEqual(list(smart_sort(values, engine)), sorted(values))
+
+    def test_float_outside_sample(self):
+        """Does a float the profile never sampled fall back to Timsort?"""
+        values = list(range(5000))
+        values[2500] = 2.5
+        self.assertEqual(smart_sort(values), sorted(values))
+        self.assertEqual(smart_sort(values, "counting"), sorted(values))
+
+    def test_beyond_int64(self):
+        """Do integers wider than int64 fall back instead of overflowing?"""
+        values = [2 ** 70, 1, 5, -2 ** 65]
+        for engine in [None] + list(ENGINES):
+            self.assertEqual(smart_sort(values, engine), sorted(values))
+
+    def test_result_kind(self):
+        """Does every engine return the kind of sequence it was given?"""
+        inputs = [[3, 1, 2], array('q', [3, 1, 2])]
+        if np is not None:
+            inputs += [np.array([3, 1, 2]), np.array([3.5, 1.0, 2.0])]
+        for values in inputs:
+            for engine in ENGINES:
+                result = smart_sort(values, engine)
+                self.assertIs(type(result), type(values))
+                self.assertEqual(list(result), sorted(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
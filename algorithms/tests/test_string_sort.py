@@ -0,0 +1,35 @@
+import random
+import unittest
+
+from algorithms.string_sort import msd_radix_sort, sort_spans, token_spans
+
+
+class StringSortTestCase(unittest.TestCase):
+    """Tests for 'string_sort.py'."""
+
+    def test_bytes(self):
+        """Does MSD radix sort order byte strings like sorted()?"""
+        rng = random.Random(5)
+        words = [bytes(rng.choice(b"abc") for _ in range(rng.randrange(6)))
+                 for _ in range(500)]
+        self.assertEqual(list(msd_radix_sort(words)), sorted(words))
+
+    def test_shared_prefixes_and_str(self):
+        """Are long shared prefixes, empty strings and str handled?"""
+        rng = random.Random(6)
+        words = ["x" * 300 + "".join(rng.choice("ab") for _ in range(rng.randrange(4)))
+                 for _ in range(300)]
+        words += ["", "x", "b", "x" * 300]
+        self.assertEqual(msd_radix_sort(words), sorted(words))
+
+    def test_spans(self):
+        """Do mmap-style spans sort like the tokens they cover?"""
+        data = b"the cat and the hat sat on a mat that the cat ate"
+        spans = token_spans(data)
+        ordered = sort_spans(data, spans)
+        self.assertEqual([data[start:end] for start, end in ordered],
+                         sorted(data[start:end] for start, end in spans))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+"""Process pools and shared memory blocks for the parallel algorithms."""
+import multiprocessing
+from multiprocessing import shared_memory
+
+
+def attach(name):
+    """Open the existing shared memory block name without owning it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching also registers the block, which is
+        # harmless here: pool workers share the parent's resource tracker.
+        return shared_memory.SharedMemory(name=name)
+
+
+def make_pool(processes, initializer=None, initargs=()):
+    """Pool whose workers each run initializer(*initargs) once on start.
+
+    Where fork is available the workers inherit initargs instead of
+    unpickling a copy each, so handing them a large graph costs nothing.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    return context.Pool(processes, initializer=initializer, initargs=initargs)